@@ -9,29 +9,64 @@ A simple demonstration of Ren's capabilities including:
 - Trust-building through humor and self-awareness
 """
 
+import asyncio
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+_SRC = os.path.join(os.path.dirname(__file__), 'src')
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from ren.ren_core import RenCore
-import json
+from privacy.digital_guardian import DigitalGuardian
+
+# Section separators
+SEP_40 = "-" * 40
+SEP_50 = "-" * 50
+SEP_60 = "=" * 60
+
+# Fixed trait order for display; analyze_text() always returns all five
+BIG_FIVE_TRAITS = ("openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism")
+TRAIT_LEVELS = ("Low", "Moderate", "High")
+
+# Output templates for the digital guardian demo
+FINDING_TEMPLATE = "  {emoji} {platform}: {content}\n     Recommendation: {recommendation}\n\n"
+RECOMMENDATION_TEMPLATE = "  • {title}\n    {description}\n    Priority: {priority}, Difficulty: {difficulty}\n\n"
+
+
+class Out:
+    """Collect demo output and write it to stdout in a single call."""
+    
+    def __init__(self):
+        self.parts = []
+    
+    def line(self, text=""):
+        """Queue one line of output."""
+        self.parts.append(text + "\n")
+    
+    def write(self, text):
+        """Queue already formatted text as-is."""
+        self.parts.append(text)
+    
+    def flush(self):
+        """Write all queued output at once."""
+        sys.stdout.write("".join(self.parts))
+        self.parts.clear()
 
 
-def print_separator(title=""):
+def print_separator(out, title=""):
     """Print a nice separator for demo sections."""
-    print("\n" + "="*60)
+    out.line("\n" + SEP_60)
     if title:
-        print(f" {title} ")
-        print("="*60)
-    print()
+        out.line(f" {title} ")
+        out.line(SEP_60)
+    out.line()
 
 
-def demo_personality_analysis():
+def demo_personality_analysis(ren):
     """Demonstrate personality analysis capabilities."""
-    print_separator("PERSONALITY ANALYSIS DEMO")
-    
-    # Create a Ren instance for demo user
-    ren = RenCore("demo_user")
+    out = Out()
+    print_separator(out, "PERSONALITY ANALYSIS DEMO")
     
     # Sample messages with different personality indicators
     test_messages = [
@@ -46,30 +81,31 @@ def demo_personality_analysis():
         "Had a great time at the party last night! Met so many interesting people and stayed up way too late talking."
     ]
     
-    print("Analyzing sample messages for personality traits...\n")
+    out.line("Analyzing sample messages for personality traits...\n")
     
-    for i, message in enumerate(test_messages, 1):
-        print(f"Message {i}: \"{message[:50]}...\"\n")
-        
-        # Analyze the message
-        personality_scores = ren.personality_analyzer.analyze_text(message)
+    # Analyze all messages in one batch, then walk the results for printing
+    all_scores = ren.personality_analyzer.analyze_texts(test_messages)
+    
+    for i, (message, personality_scores) in enumerate(zip(test_messages, all_scores), 1):
+        out.line(f"Message {i}: \"{message[:50]}...\"\n")
         
         # Show main Big Five scores
-        print("Big Five Personality Indicators:")
-        for trait in ["openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism"]:
-            if trait in personality_scores:
-                score = personality_scores[trait]
-                level = "High" if score > 0.6 else "Low" if score < 0.4 else "Moderate"
-                print(f"  {trait.title()}: {score:.2f} ({level})")
+        out.line("Big Five Personality Indicators:")
+        for trait in BIG_FIVE_TRAITS:
+            score = personality_scores[trait]
+            # Bucket index: 0 below 0.4, 1 from 0.4 to 0.6, 2 above 0.6
+            level = TRAIT_LEVELS[(score >= 0.4) + (score > 0.6)]
+            out.line(f"  {trait.title()}: {score:.2f} ({level})")
         
-        print("\n" + "-"*40 + "\n")
+        out.line("\n" + SEP_40 + "\n")
+    
+    out.flush()
 
 
-def demo_communication_learning():
+def demo_communication_learning(ren):
     """Demonstrate communication style learning."""
-    print_separator("COMMUNICATION STYLE LEARNING DEMO")
-    
-    ren = RenCore("demo_user")
+    out = Out()
+    print_separator(out, "COMMUNICATION STYLE LEARNING DEMO")
     
     # Simulate a conversation to show style learning
     conversation = [
@@ -80,36 +116,34 @@ def demo_communication_learning():
         "Wow, that sounds incredibly complex but also really cool. I bet you're learning tons!"
     ]
     
-    print("Learning communication style from conversation...\n")
+    out.line("Learning communication style from conversation...\n")
     
     for i, message in enumerate(conversation, 1):
-        print(f"User: {message}")
-        
-        # Analyze communication style
-        style_analysis = ren.style_learner.analyze_message(message)
+        out.line(f"User: {message}")
         
-        # Generate Ren's response
+        # Generate Ren's response (chat also learns the communication style)
         ren_response = ren.chat(message)
-        print(f"Ren: {ren_response}\n")
+        out.line(f"Ren: {ren_response}\n")
         
         # Show what Ren learned
         if i % 2 == 0:  # Show learning every other message
             summary = ren.style_learner.get_communication_summary()
-            print("📊 What Ren has learned about your style:")
-            print(f"  Vocabulary Level: {summary['patterns']['vocabulary_level']:.2f}")
-            print(f"  Formality Level: {summary['patterns']['formality_level']:.2f}")
-            print(f"  Emotional Expressiveness: {summary['patterns']['emotional_expressiveness']:.2f}")
-            print(f"  Question Frequency: {summary['patterns']['question_frequency']:.2f}")
-            print()
+            out.line("📊 What Ren has learned about your style:")
+            out.line(f"  Vocabulary Level: {summary['patterns']['vocabulary_level']:.2f}")
+            out.line(f"  Formality Level: {summary['patterns']['formality_level']:.2f}")
+            out.line(f"  Emotional Expressiveness: {summary['patterns']['emotional_expressiveness']:.2f}")
+            out.line(f"  Question Frequency: {summary['patterns']['question_frequency']:.2f}")
+            out.line()
         
-        print("-"*50 + "\n")
+        out.line(SEP_50 + "\n")
+    
+    out.flush()
 
 
-def demo_digital_guardian():
+def demo_digital_guardian(ren):
     """Demonstrate digital privacy protection."""
-    print_separator("DIGITAL PRIVACY PROTECTION DEMO")
-    
-    ren = RenCore("demo_user")
+    out = Out()
+    print_separator(out, "DIGITAL PRIVACY PROTECTION DEMO")
     
     # Simulate user providing basic info
     user_info = {
@@ -118,54 +152,61 @@ def demo_digital_guardian():
         "location": "Seattle, WA"
     }
     
-    print(f"User provides basic information:")
-    print(f"Name: {user_info['name']}")
-    print(f"Age: {user_info['age']}")
-    print(f"Location: {user_info['location']}\n")
+    out.line(f"User provides basic information:")
+    out.line(f"Name: {user_info['name']}")
+    out.line(f"Age: {user_info['age']}")
+    out.line(f"Location: {user_info['location']}\n")
     
     # Start digital research
-    print("Ren starts researching digital footprint...\n")
+    out.line("Ren starts researching digital footprint...\n")
     research_status = ren.digital_guardian.start_research(user_info)
-    print(f"Status: {research_status['message']}\n")
+    out.line(f"Status: {research_status['message']}\n")
     
     # Get results
     results = ren.digital_guardian.get_research_results()
     
-    print("🔍 Research Results:")
-    print(f"Overall Privacy Risk: {results['privacy_assessment']['overall_risk'].upper()}")
-    print(f"Total Findings: {results['privacy_assessment']['total_findings']}")
-    print(f"High Risk Items: {results['privacy_assessment']['high_risk_items']}")
-    print()
+    out.line("🔍 Research Results:")
+    out.line(f"Overall Privacy Risk: {results['privacy_assessment']['overall_risk'].upper()}")
+    out.line(f"Total Findings: {results['privacy_assessment']['total_findings']}")
+    out.line(f"High Risk Items: {results['privacy_assessment']['high_risk_items']}")
+    out.line()
     
-    print("📋 Sample Findings:")
-    for finding in results['findings'][:3]:  # Show first 3 findings
-        risk_emoji = "🔴" if finding['privacy_risk'] == "high" else "🟡" if finding['privacy_risk'] == "medium" else "🟢"
-        print(f"  {risk_emoji} {finding['platform']}: {finding['content']}")
-        print(f"     Recommendation: {finding['recommendation']}")
-        print()
+    out.line("📋 Sample Findings:")
+    out.write("".join(
+        FINDING_TEMPLATE.format(
+            emoji=DigitalGuardian.RISK_EMOJI.get(finding['privacy_risk'], "🟢"),
+            **finding
+        )
+        for finding in results['findings'][:3]  # Show first 3 findings
+    ))
     
-    print("💡 Top Recommendations:")
-    for rec in results['recommendations'][:3]:  # Show first 3 recommendations
-        print(f"  • {rec['title']}")
-        print(f"    {rec['description']}")
-        print(f"    Priority: {rec['priority'].title()}, Difficulty: {rec['difficulty'].title()}")
-        print()
+    out.line("💡 Top Recommendations:")
+    out.write("".join(
+        RECOMMENDATION_TEMPLATE.format(
+            title=rec['title'],
+            description=rec['description'],
+            priority=rec['priority'].title(),
+            difficulty=rec['difficulty'].title()
+        )
+        for rec in results['recommendations'][:3]  # Show first 3 recommendations
+    ))
+    
+    out.flush()
 
 
-def demo_personality_development():
+async def demo_personality_development(ren):
     """Demonstrate how Ren's personality develops."""
-    print_separator("REN'S PERSONALITY DEVELOPMENT DEMO")
-    
-    ren = RenCore("demo_user")
+    out = Out()
+    print_separator(out, "REN'S PERSONALITY DEVELOPMENT DEMO")
     
     # Show initial personality
     initial_personality = ren.get_personality_summary()
-    print("Ren's Initial Personality:")
-    print(f"Trust Level: {initial_personality['trust_level']:.2f}")
-    print(f"Development Stage: {initial_personality['development_stage']}")
-    print(f"Humor Style: {ren.ren_personality['humor_style']}")
-    print(f"Curiosity Level: {ren.ren_personality['curiosity_level']:.2f}")
-    print()
+    out.line("Ren's Initial Personality:")
+    out.line(f"Trust Level: {initial_personality['trust_level']:.2f}")
+    out.line(f"Development Stage: {initial_personality['development_stage']}")
+    out.line(f"Humor Style: {ren.ren_personality['humor_style']}")
+    out.line(f"Curiosity Level: {ren.ren_personality['curiosity_level']:.2f}")
+    out.line()
     
     # Simulate several interactions to show personality evolution
     interactions = [
@@ -176,42 +217,47 @@ def demo_personality_development():
         "I feel like I can trust you with more personal stuff."
     ]
     
-    print("Simulating personality development through interactions...\n")
+    out.line("Simulating personality development through interactions...\n")
     
     for i, message in enumerate(interactions, 1):
-        print(f"Interaction {i}:")
-        print(f"User: {message}")
+        out.line(f"Interaction {i}:")
+        out.line(f"User: {message}")
         
-        response = ren.chat(message)
-        print(f"Ren: {response}")
+        # Each turn is awaited before the summary so it reflects that turn
+        response = await ren.chat_async(message)
+        out.line(f"Ren: {response}")
         
         # Show personality evolution
         current_personality = ren.get_personality_summary()
-        print(f"Trust Level: {current_personality['trust_level']:.2f}")
-        print(f"Development Stage: {current_personality['development_stage']}")
-        print()
-        print("-"*50 + "\n")
+        out.line(f"Trust Level: {current_personality['trust_level']:.2f}")
+        out.line(f"Development Stage: {current_personality['development_stage']}")
+        out.line()
+        out.line(SEP_50 + "\n")
+    
+    out.flush()
 
 
-def demo_timeline_context():
+def demo_timeline_context(ren):
     """Demonstrate age-based timeline context."""
-    print_separator("AGE-BASED TIMELINE CONTEXT DEMO")
-    
-    ren = RenCore("demo_user")
+    out = Out()
+    print_separator(out, "AGE-BASED TIMELINE CONTEXT DEMO")
     
     # Test different ages
     test_ages = [16, 25, 35, 65]
     
-    for age in test_ages:
-        print(f"Timeline context for {age}-year-old user:")
-        timeline = ren.get_user_timeline(age)
+    timelines = ren.get_user_timelines(test_ages)
+    
+    for age, timeline in zip(test_ages, timelines):
+        out.line(f"Timeline context for {age}-year-old user:")
         
-        print(f"  Birth Year: {timeline['birth_year']}")
-        print(f"  High School: {timeline['high_school_years'][0]}-{timeline['high_school_years'][1]}")
-        print(f"  Digital Era: {timeline['digital_native_era']['era']}")
-        print(f"  Context: {timeline['digital_native_era']['context']}")
-        print(f"  Platforms During Youth: {', '.join(timeline['major_social_platforms_during_youth'][:3])}")
-        print()
+        out.line(f"  Birth Year: {timeline['birth_year']}")
+        out.line(f"  High School: {timeline['high_school_years'][0]}-{timeline['high_school_years'][1]}")
+        out.line(f"  Digital Era: {timeline['digital_native_era']['era']}")
+        out.line(f"  Context: {timeline['digital_native_era']['context']}")
+        out.line(f"  Platforms During Youth: {', '.join(timeline['major_social_platforms_during_youth'][:3])}")
+        out.line()
+    
+    out.flush()
 
 
 def main():
@@ -220,25 +266,36 @@ def main():
     print("Demonstrating Ren AI Companion capabilities...")
     
     try:
+        # One Ren instance is shared by all demo sections
+        ren = RenCore("demo_user")
+        
         # Run all demo sections
-        demo_personality_analysis()
-        demo_communication_learning()
-        demo_digital_guardian()
-        demo_personality_development()
-        demo_timeline_context()
-        
-        print_separator("DEMO COMPLETE")
-        print("This demo shows how Ren:")
-        print("✓ Analyzes personality traits from text")
-        print("✓ Learns communication styles and adapts")
-        print("✓ Protects digital privacy proactively")
-        print("✓ Develops complementary personality traits")
-        print("✓ Provides age-appropriate context and understanding")
-        print()
-        print("Ren builds trust through humor, helpfulness, and genuine care")
-        print("for the user's privacy and wellbeing.")
-        print()
-        print("Ready to start building your own Ren? 🚀")
+        demo_personality_analysis(ren)
+        demo_communication_learning(ren)
+        demo_digital_guardian(ren)
+        
+        # Start personality development from Ren's initial state
+        ren.reset_session()
+        asyncio.run(demo_personality_development(ren))
+        demo_timeline_context(ren)
+        
+        # Write any buffered conversations before exiting
+        ren.close()
+        
+        out = Out()
+        print_separator(out, "DEMO COMPLETE")
+        out.line("This demo shows how Ren:")
+        out.line("✓ Analyzes personality traits from text")
+        out.line("✓ Learns communication styles and adapts")
+        out.line("✓ Protects digital privacy proactively")
+        out.line("✓ Develops complementary personality traits")
+        out.line("✓ Provides age-appropriate context and understanding")
+        out.line()
+        out.line("Ren builds trust through humor, helpfulness, and genuine care")
+        out.line("for the user's privacy and wellbeing.")
+        out.line()
+        out.line("Ready to start building your own Ren? 🚀")
+        out.flush()
         
     except Exception as e:
         print(f"Demo error: {e}")
@@ -7,10 +7,35 @@ helping Ren adapt its responses to match the user's preferred communication patt
 
 import re
 from typing import Dict, List, Tuple, Optional
-from collections import Counter, defaultdict
+from collections import Counter, defaultdict, deque
+from functools import lru_cache
+from itertools import islice
 import json
 
 
+# Compiled once at import; these run on every analyzed message
+_TOKEN_RE = re.compile(r'\b\w+\b')
+_SENTENCE_RE = re.compile(r'[.!?]+')
+_QUESTION_SPLIT_RE = re.compile(r'[.!]')
+_SENTENCE_END_RE = re.compile(r'[.!?]')
+
+def _build_keyword_index(keyword_sets: Dict[str, frozenset]) -> Dict[str, Tuple[str, ...]]:
+    """Invert category -> keywords into keyword -> categories."""
+    index = defaultdict(set)
+    for category, keywords in keyword_sets.items():
+        for keyword in keywords:
+            index[keyword].add(category)
+    return {keyword: tuple(categories) for keyword, categories in index.items()}
+
+def _copy_analysis(value):
+    """Copy an analysis deeply enough that callers can't alter a cached one."""
+    if isinstance(value, dict):
+        return {key: _copy_analysis(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
 class StyleLearner:
     """
     Learns and analyzes user communication patterns.
@@ -23,6 +48,120 @@ class StyleLearner:
     - Topic preferences and interests
     """
     
+    # Sarcastic keywords shared by the humor and sarcasm detectors
+    SARCASM_WORDS = frozenset({"obviously", "clearly", "sure", "right", "totally", "absolutely"})
+    
+    # Keyword sets whose matches are simply counted per message
+    KEYWORD_SETS = {
+        # Emotional expression
+        "excitement": frozenset({"amazing", "awesome", "incredible", "fantastic", "wow", "omg"}),
+        "enthusiasm": frozenset({"love", "excited", "can't wait", "looking forward", "thrilled"}),
+        "concern": frozenset({"worried", "concerned", "anxious", "nervous", "unsure", "confused"}),
+        "affection": frozenset({"love", "care", "appreciate", "grateful", "thankful", "sweet"}),
+        "frustration": frozenset({"frustrated", "annoying", "irritating", "ugh", "seriously", "ridiculous"}),
+        
+        # Humor and sarcasm
+        "sarcastic_humor": SARCASM_WORDS,
+        "sarcasm": SARCASM_WORDS | {"perfect", "wonderful", "great", "fantastic", "amazing"},
+        
+        # Formality
+        "formal": frozenset({
+            "please", "thank you", "would", "could", "should", "might",
+            "perhaps", "possibly", "certainly", "indeed", "furthermore",
+            "however", "therefore", "consequently"
+        }),
+        "informal": frozenset({
+            "gonna", "wanna", "gotta", "yeah", "yep", "nope", "ok", "okay",
+            "cool", "awesome", "dude", "guys", "stuff", "things", "kinda",
+            "sorta", "pretty", "really", "super", "totally"
+        }),
+        "contractions": frozenset({
+            "don't", "can't", "won't", "isn't", "aren't", "wasn't", "weren't",
+            "haven't", "hasn't", "hadn't"
+        }),
+    }
+    _KEYWORD_CATEGORIES = _build_keyword_index(KEYWORD_SETS)
+    
+    # Academic/sophisticated vocabulary indicators
+    SOPHISTICATED_WORDS = frozenset({
+        "analyze", "synthesize", "conceptualize", "methodology", "paradigm",
+        "hypothesis", "empirical", "theoretical", "philosophical", "psychological",
+        "furthermore", "consequently", "nevertheless", "moreover", "therefore"
+    })
+    
+    # Keys of the per-message indicator dicts, in output order
+    EMOTION_CATEGORIES = ("excitement", "enthusiasm", "concern", "affection", "frustration")
+    HUMOR_STYLES = ("sarcastic", "self_deprecating", "wordplay", "observational", "wholesome")
+    QUESTION_TYPES = ("yes_no", "open_ended", "rhetorical")
+    
+    # Question classification vocabularies
+    _NEGATED_STARTERS = ("don't", "doesn't", "didn't", "isn't", "aren't", "wasn't", "weren't",
+                         "can't", "couldn't", "wouldn't", "shouldn't")
+    # Negative contractions ask yes/no questions too, typed with either apostrophe
+    YES_NO_STARTERS = frozenset({"do", "does", "did", "is", "are", "was", "were",
+                                 "can", "could", "will", "would", "should",
+                                 *_NEGATED_STARTERS,
+                                 *(word.replace("'", "\u2019") for word in _NEGATED_STARTERS)})
+    OPEN_QUESTION_WORDS = frozenset({"what", "how", "why", "when", "where", "who"})
+    RHETORICAL_PHRASES = ("right?", "you know?", "don't you think?")
+    
+    # Context words for self-deprecating humor and sarcasm
+    SARCASM_PHRASES = ("oh great", "just perfect", "how wonderful", "that's just")
+    # All phrases in one scan; the lookahead lets overlapping phrases match too
+    _SARCASM_PHRASE_RE = re.compile("(?=(%s))" % "|".join(map(re.escape, SARCASM_PHRASES)))
+    SELF_DEPRECATING_WORDS = frozenset({"stupid", "dumb", "idiot", "fail", "mess", "disaster"})
+    FIRST_PERSON_CONTEXT = frozenset({"i", "me", "my", "myself"})
+    LAUGH_EMOJI = ('😄', '😂', '🤣', '😆')
+    NEGATIVE_CONTEXT = frozenset({"not", "never", "can't", "won't", "don't", "isn't", "aren't"})
+    POSITIVE_WORDS = frozenset({"great", "perfect", "wonderful", "amazing", "fantastic"})
+    
+    TOPIC_KEYWORDS = {
+        "technology": frozenset({"computer", "software", "app", "tech", "digital", "online", "internet", "ai", "programming"}),
+        "work": frozenset({"job", "work", "career", "office", "business", "meeting", "project", "deadline"}),
+        "relationships": frozenset({"friend", "family", "relationship", "dating", "marriage", "love", "partner"}),
+        "hobbies": frozenset({"music", "movie", "book", "game", "sport", "art", "cooking", "travel"}),
+        "health": frozenset({"health", "exercise", "diet", "sleep", "stress", "mental", "physical"}),
+        "education": frozenset({"school", "college", "university", "study", "learn", "class", "degree"})
+    }
+    _TOPIC_INDEX = _build_keyword_index(TOPIC_KEYWORDS)
+    
+    PERSONAL_REFERENCES = {
+        "first_person": frozenset({"i", "me", "my", "myself", "mine"}),
+        "second_person": frozenset({"you", "your", "yours", "yourself"}),
+        "third_person": frozenset({"he", "she", "they", "them", "his", "her", "their"})
+    }
+    
+    # Response rewrites used by adapt_response_style, each applied in one scan
+    CASUAL_REPLACEMENTS = {
+        "I would": "I'd",
+        "cannot": "can't",
+        "do not": "don't"
+    }
+    _CASUAL_RE = re.compile("|".join(map(re.escape, CASUAL_REPLACEMENTS)))
+    SIMPLE_REPLACEMENTS = {
+        "utilize": "use",
+        "facilitate": "help",
+        "demonstrate": "show",
+        "approximately": "about",
+        "subsequently": "then"
+    }
+    _SIMPLIFY_RE = re.compile("|".join(map(re.escape, SIMPLE_REPLACEMENTS)))
+    
+    # Messages shorter than this (in characters or words) carry too little
+    # signal to analyze and are not learned from
+    TRIVIAL_MESSAGE_CHARS = 8
+    TRIVIAL_MESSAGE_WORDS = 3
+    
+    # Exponential moving average learning rate for user patterns
+    LEARNING_RATE = 0.1
+    _EMA_RETAIN = 1 - LEARNING_RATE
+    
+    # Number of distinct recent messages whose analysis is cached
+    ANALYSIS_CACHE_SIZE = 256
+    
+    # Number of recent message analyses kept for trend detection
+    HISTORY_LIMIT = 200
+    
     def __init__(self):
         """Initialize the style learner."""
         self.user_patterns = {
@@ -32,14 +171,21 @@ class StyleLearner:
             "emotional_expressiveness": 0.5,  # 0=reserved, 1=expressive
             "formality_level": 0.5,  # 0=casual, 1=formal
             "question_frequency": 0.5,  # How often they ask questions
-            "topic_interests": [],
+            "topic_interests": set(),
             "communication_quirks": []
         }
         
-        # Track patterns over time
-        self.message_history = []
+        # Track patterns over time; only recent analyses are kept
+        self.message_history = deque(maxlen=self.HISTORY_LIMIT)
+        self.messages_analyzed = 0
         self.pattern_evolution = []
         
+        # (messages_analyzed, summary) for the last computed summary
+        self._summary_cache = None
+        
+        # Repeated messages ("ok", "thanks", ...) reuse their earlier analysis
+        self._cached_analysis = lru_cache(maxsize=self.ANALYSIS_CACHE_SIZE)(self._analyze)
+        
     def analyze_message(self, message: str) -> Dict[str, any]:
         """
         Analyze a single message for communication style indicators.
@@ -50,82 +196,180 @@ class StyleLearner:
         Returns:
             Dictionary of style indicators found in this message
         """
-        analysis = {}
+        analysis = self._cached_analysis(message)
+        if analysis is None:
+            return self._trivial_analysis()
+        
+        self._learn(analysis)
+        return _copy_analysis(analysis)
+    
+    def analyze_messages(self, messages: List[str]) -> List[Dict[str, any]]:
+        """
+        Analyze a batch of messages, e.g. an existing chat log.
+        
+        Messages are learned from in order, so the resulting patterns are the
+        same as calling analyze_message() on each one in turn.
+        
+        Args:
+            messages: The user's messages to analyze, oldest first
+            
+        Returns:
+            List of style indicator dictionaries, one per message
+        """
+        analyze = self._cached_analysis
+        analyses = [analyze(message) for message in messages]
+        
+        learn = self._learn
+        for i, analysis in enumerate(analyses):
+            if analysis is None:
+                analyses[i] = self._trivial_analysis()
+            else:
+                learn(analysis)
+                analyses[i] = _copy_analysis(analysis)
+        
+        return analyses
+    
+    def _analyze(self, message: str) -> Optional[Dict[str, any]]:
+        """
+        Compute the style indicators for one message without learning from it.
         
-        # Basic text processing
-        words = self._tokenize(message.lower())
+        Returns None for trivially short messages, which are not analyzed.
+        """
+        if len(message) < self.TRIVIAL_MESSAGE_CHARS:
+            return None
+        
+        # Basic text processing; the message is lowercased once for all detectors
+        message_lower = message.lower()
+        words = self._tokenize(message_lower)
+        if len(words) < self.TRIVIAL_MESSAGE_WORDS:
+            return None
+        
+        analysis = {}
         sentences = self._split_sentences(message)
         
+        # Look every word up once; detectors read keyword hits per category
+        word_counts = Counter(words)
+        category_counts = self._count_categories(word_counts)
+        
         # Vocabulary analysis
-        analysis["vocabulary_complexity"] = self._analyze_vocabulary_complexity(words)
-        analysis["unique_word_ratio"] = len(set(words)) / max(len(words), 1)
+        analysis["vocabulary_complexity"], analysis["unique_word_ratio"] = self._analyze_vocabulary(
+            len(words), word_counts)
         
         # Sentence structure
         analysis["avg_sentence_length"] = sum(len(s.split()) for s in sentences) / max(len(sentences), 1)
         analysis["sentence_variety"] = self._analyze_sentence_variety(sentences)
         
-        # Emotional expression
-        analysis["emotional_indicators"] = self._detect_emotional_expression(message, words)
-        analysis["punctuation_style"] = self._analyze_punctuation(message)
+        # Emotional expression (punctuation is counted once and shared)
+        punctuation = self._analyze_punctuation(message)
+        analysis["emotional_indicators"] = self._detect_emotional_expression(message, words, category_counts, punctuation)
+        analysis["punctuation_style"] = punctuation
         
         # Humor and personality
-        analysis["humor_indicators"] = self._detect_humor_style(message, words)
-        analysis["sarcasm_likelihood"] = self._detect_sarcasm(message, words)
+        analysis["humor_indicators"] = self._detect_humor_style(message, message_lower, words, category_counts)
+        analysis["sarcasm_likelihood"] = self._detect_sarcasm(words, category_counts, punctuation)
         
         # Formality and tone
-        analysis["formality_indicators"] = self._analyze_formality(words, message)
-        analysis["question_patterns"] = self._analyze_questions(message)
+        analysis["formality_indicators"] = self._analyze_formality(words, message, category_counts)
+        analysis["question_patterns"] = self._analyze_questions(message_lower)
         
         # Topic and interest extraction
-        analysis["topics_mentioned"] = self._extract_topics(words)
-        analysis["personal_references"] = self._count_personal_references(words)
+        analysis["topics_mentioned"] = self._extract_topics(word_counts)
+        analysis["personal_references"] = self._count_personal_references(word_counts)
         
-        # Store for pattern learning
+        return analysis
+    
+    def _learn(self, analysis: Dict[str, any]):
+        """Record an analysis in the history and fold it into learned patterns."""
+        # Store for pattern learning (the raw text is not needed later)
         self.message_history.append({
-            "message": message,
             "analysis": analysis,
-            "timestamp": len(self.message_history)  # Simple counter for now
+            "timestamp": self.messages_analyzed  # Simple counter for now
         })
+        self.messages_analyzed += 1
         
         # Update learned patterns
         self._update_patterns(analysis)
-        
-        return analysis
+    
+    def _trivial_analysis(self) -> Dict[str, any]:
+        """Return neutral indicators for a message too short to analyze."""
+        return {
+            "vocabulary_complexity": 0.5,
+            "unique_word_ratio": 0.0,
+            "avg_sentence_length": 0.0,
+            "sentence_variety": 0.5,
+            "emotional_indicators": dict.fromkeys(self.EMOTION_CATEGORIES, 0.0),
+            "punctuation_style": {
+                "exclamation_marks": 0,
+                "question_marks": 0,
+                "ellipses": 0,
+                "dashes": 0,
+                "parentheses": 0,
+                "quotation_marks": 0
+            },
+            "humor_indicators": dict.fromkeys(self.HUMOR_STYLES, 0.0),
+            "sarcasm_likelihood": 0.0,
+            "formality_indicators": {
+                "formal_words": 0.0,
+                "informal_words": 0.0,
+                "contractions": 0.0,
+                "proper_capitalization": 0.0
+            },
+            "question_patterns": {
+                "total_questions": 0,
+                "question_types": dict.fromkeys(self.QUESTION_TYPES, 0),
+                "question_ratio": 0.0
+            },
+            "topics_mentioned": [],
+            "personal_references": {person: 0 for person in self.PERSONAL_REFERENCES}
+        }
     
     def _tokenize(self, text: str) -> List[str]:
         """Simple tokenization."""
-        return [word for word in re.findall(r'\b\w+\b', text) if len(word) > 1]
+        return [word for word in _TOKEN_RE.findall(text) if len(word) > 1]
+    
+    def _count_categories(self, word_counts: Counter) -> Counter:
+        """Count keyword hits per category from the message's word counts."""
+        category_counts = Counter()
+        for word, count in word_counts.items():
+            for category in self._KEYWORD_CATEGORIES.get(word, ()):
+                category_counts[category] += count
+        return category_counts
     
     def _split_sentences(self, text: str) -> List[str]:
         """Split text into sentences."""
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENTENCE_RE.split(text)
         return [s.strip() for s in sentences if s.strip()]
     
-    def _analyze_vocabulary_complexity(self, words: List[str]) -> float:
+    def _analyze_vocabulary(self, word_total: int, word_counts: Counter) -> Tuple[float, float]:
         """
         Analyze vocabulary complexity based on word length and sophistication.
         
-        Returns score from 0 (simple) to 1 (complex).
-        """
-        if not words:
-            return 0.5
+        All statistics are gathered in one pass over the distinct words.
         
-        # Average word length
-        avg_word_length = sum(len(word) for word in words) / len(words)
-        
-        # Complex word indicators (simplified)
-        complex_words = [word for word in words if len(word) > 6]
-        complex_ratio = len(complex_words) / len(words)
-        
-        # Academic/sophisticated vocabulary indicators
-        sophisticated_words = [
-            "analyze", "synthesize", "conceptualize", "methodology", "paradigm",
-            "hypothesis", "empirical", "theoretical", "philosophical", "psychological",
-            "furthermore", "consequently", "nevertheless", "moreover", "therefore"
-        ]
-        
-        sophisticated_count = sum(1 for word in words if word in sophisticated_words)
-        sophisticated_ratio = sophisticated_count / len(words)
+        Returns:
+            Tuple of complexity score from 0 (simple) to 1 (complex) and the
+            ratio of unique words
+        """
+        if not word_total:
+            return 0.5, 0.0
+        
+        total_length = 0
+        complex_count = 0
+        sophisticated_count = 0
+        sophisticated_words = self.SOPHISTICATED_WORDS
+        for word, count in word_counts.items():
+            length = len(word)
+            total_length += length * count
+            # Complex word indicators (simplified)
+            if length > 6:
+                complex_count += count
+            # Academic/sophisticated vocabulary indicators
+            if word in sophisticated_words:
+                sophisticated_count += count
+        
+        avg_word_length = total_length / word_total
+        complex_ratio = complex_count / word_total
+        sophisticated_ratio = sophisticated_count / word_total
         
         # Combine indicators
         complexity_score = (
@@ -134,62 +378,44 @@ class StyleLearner:
             sophisticated_ratio * 10 * 0.2  # Sophisticated vocabulary component
         )
         
-        return min(1.0, max(0.0, complexity_score))
+        return min(1.0, max(0.0, complexity_score)), len(word_counts) / word_total
     
     def _analyze_sentence_variety(self, sentences: List[str]) -> float:
         """Analyze variety in sentence structure."""
         if len(sentences) < 2:
             return 0.5
         
-        lengths = [len(s.split()) for s in sentences]
-        
-        # Calculate coefficient of variation (std dev / mean)
-        if not lengths or sum(lengths) == 0:
-            return 0.5
-        
-        mean_length = sum(lengths) / len(lengths)
-        variance = sum((x - mean_length) ** 2 for x in lengths) / len(lengths)
-        std_dev = variance ** 0.5
+        # Single pass collecting integer totals of lengths and squared lengths
+        count = len(sentences)
+        total = 0
+        total_sq = 0
+        for sentence in sentences:
+            length = len(sentence.split())
+            total += length
+            total_sq += length * length
         
-        if mean_length == 0:
+        if total == 0:
             return 0.5
         
-        variety_score = std_dev / mean_length
+        # Coefficient of variation (std dev / mean); with integer totals this is
+        # sqrt(n * sum(x^2) - sum(x)^2) / sum(x), exact up to the square root
+        variety_score = (count * total_sq - total * total) ** 0.5 / total
         return min(1.0, variety_score)
     
-    def _detect_emotional_expression(self, message: str, words: List[str]) -> Dict[str, float]:
+    def _detect_emotional_expression(self, message: str, words: List[str], category_counts: Counter,
+                                     punctuation: Dict[str, int]) -> Dict[str, float]:
         """Detect emotional expression patterns."""
+        word_total = max(len(words), 1)
+        
+        # Keyword share of each emotion category
         emotions = {
-            "excitement": 0.0,
-            "enthusiasm": 0.0,
-            "concern": 0.0,
-            "affection": 0.0,
-            "frustration": 0.0
+            emotion: category_counts[emotion] / word_total
+            for emotion in self.EMOTION_CATEGORIES
         }
         
-        # Excitement indicators
-        excitement_words = ["amazing", "awesome", "incredible", "fantastic", "wow", "omg"]
-        excitement_punctuation = message.count('!') + message.count('!!!')
-        emotions["excitement"] = (
-            sum(1 for word in words if word in excitement_words) / max(len(words), 1) +
-            excitement_punctuation / max(len(message), 1) * 10
-        )
-        
-        # Enthusiasm indicators  
-        enthusiasm_words = ["love", "excited", "can't wait", "looking forward", "thrilled"]
-        emotions["enthusiasm"] = sum(1 for word in words if word in enthusiasm_words) / max(len(words), 1)
-        
-        # Concern indicators
-        concern_words = ["worried", "concerned", "anxious", "nervous", "unsure", "confused"]
-        emotions["concern"] = sum(1 for word in words if word in concern_words) / max(len(words), 1)
-        
-        # Affection indicators
-        affection_words = ["love", "care", "appreciate", "grateful", "thankful", "sweet"]
-        emotions["affection"] = sum(1 for word in words if word in affection_words) / max(len(words), 1)
-        
-        # Frustration indicators
-        frustration_words = ["frustrated", "annoying", "irritating", "ugh", "seriously", "ridiculous"]
-        emotions["frustration"] = sum(1 for word in words if word in frustration_words) / max(len(words), 1)
+        # Excitement also shows in punctuation
+        excitement_punctuation = punctuation["exclamation_marks"] + message.count('!!!')
+        emotions["excitement"] += excitement_punctuation / max(len(message), 1) * 10
         
         return emotions
     
@@ -204,97 +430,65 @@ class StyleLearner:
             "quotation_marks": message.count('"') + message.count("'")
         }
     
-    def _detect_humor_style(self, message: str, words: List[str]) -> Dict[str, float]:
+    def _detect_humor_style(self, message: str, message_lower: str, words: List[str],
+                            category_counts: Counter) -> Dict[str, float]:
         """Detect different types of humor."""
-        humor_styles = {
-            "sarcastic": 0.0,
-            "self_deprecating": 0.0,
-            "wordplay": 0.0,
-            "observational": 0.0,
-            "wholesome": 0.0
-        }
+        humor_styles = dict.fromkeys(self.HUMOR_STYLES, 0.0)
         
         # Sarcasm indicators
-        sarcasm_words = ["obviously", "clearly", "sure", "right", "totally", "absolutely"]
-        sarcasm_phrases = ["oh great", "just perfect", "how wonderful", "that's just"]
-        
-        sarcasm_score = sum(1 for word in words if word in sarcasm_words) / max(len(words), 1)
-        for phrase in sarcasm_phrases:
-            if phrase in message.lower():
-                sarcasm_score += 0.1
+        sarcasm_score = category_counts["sarcastic_humor"] / max(len(words), 1)
+        for _ in set(self._SARCASM_PHRASE_RE.findall(message_lower)):
+            sarcasm_score += 0.1
         
         humor_styles["sarcastic"] = sarcasm_score
         
         # Self-deprecating humor
-        self_deprecating_words = ["stupid", "dumb", "idiot", "fail", "mess", "disaster"]
-        first_person = ["i", "me", "my", "myself"]
-        
         # Check if self-deprecating words are used with first person
         self_deprecating_score = 0.0
-        for i, word in enumerate(words):
-            if word in self_deprecating_words:
-                # Check surrounding words for first person
-                context = words[max(0, i-3):i+4]
-                if any(fp in context for fp in first_person):
-                    self_deprecating_score += 0.1
+        first_person = self.FIRST_PERSON_CONTEXT
+        # Windows can only match if the message has a first person word at all
+        if not first_person.isdisjoint(words):
+            for i, word in enumerate(words):
+                if word in self.SELF_DEPRECATING_WORDS:
+                    # Check surrounding words for first person
+                    if not first_person.isdisjoint(words[max(0, i-3):i+4]):
+                        self_deprecating_score += 0.1
         
         humor_styles["self_deprecating"] = self_deprecating_score
         
         # Wordplay detection (simplified)
-        if any(char in message for char in ['😄', '😂', '🤣', '😆']) or 'lol' in message.lower() or 'haha' in message.lower():
+        if any(char in message for char in self.LAUGH_EMOJI) or 'lol' in message_lower or 'haha' in message_lower:
             humor_styles["wordplay"] = 0.1
         
         return humor_styles
     
-    def _detect_sarcasm(self, message: str, words: List[str]) -> float:
+    def _detect_sarcasm(self, words: List[str], category_counts: Counter, punctuation: Dict[str, int]) -> float:
         """Detect likelihood of sarcasm in the message."""
-        sarcasm_indicators = [
-            "obviously", "clearly", "sure", "right", "totally", "absolutely",
-            "perfect", "wonderful", "great", "fantastic", "amazing"
-        ]
-        
-        # Context matters for sarcasm
-        negative_context = ["not", "never", "can't", "won't", "don't", "isn't", "aren't"]
-        
         sarcasm_score = 0.0
         
         # Direct sarcasm words
-        sarcasm_score += sum(1 for word in words if word in sarcasm_indicators) / max(len(words), 1)
+        sarcasm_score += category_counts["sarcasm"] / max(len(words), 1)
         
         # Positive words in negative context
-        positive_words = ["great", "perfect", "wonderful", "amazing", "fantastic"]
-        for i, word in enumerate(words):
-            if word in positive_words:
-                # Check for negative context nearby
-                context = words[max(0, i-2):i+3]
-                if any(neg in context for neg in negative_context):
-                    sarcasm_score += 0.2
+        negative_context = self.NEGATIVE_CONTEXT
+        if not negative_context.isdisjoint(words):
+            for i, word in enumerate(words):
+                if word in self.POSITIVE_WORDS:
+                    # Check for negative context nearby
+                    if not negative_context.isdisjoint(words[max(0, i-2):i+3]):
+                        sarcasm_score += 0.2
         
         # Excessive punctuation can indicate sarcasm
-        if message.count('!') > 2 or '...' in message:
+        if punctuation["exclamation_marks"] > 2 or punctuation["ellipses"]:
             sarcasm_score += 0.1
         
         return min(1.0, sarcasm_score)
     
-    def _analyze_formality(self, words: List[str], message: str) -> Dict[str, float]:
+    def _analyze_formality(self, words: List[str], message: str, category_counts: Counter) -> Dict[str, float]:
         """Analyze formality level of communication."""
-        formal_indicators = [
-            "please", "thank you", "would", "could", "should", "might",
-            "perhaps", "possibly", "certainly", "indeed", "furthermore",
-            "however", "therefore", "consequently"
-        ]
-        
-        informal_indicators = [
-            "gonna", "wanna", "gotta", "yeah", "yep", "nope", "ok", "okay",
-            "cool", "awesome", "dude", "guys", "stuff", "things", "kinda",
-            "sorta", "pretty", "really", "super", "totally"
-        ]
-        
-        contractions = ["don't", "can't", "won't", "isn't", "aren't", "wasn't", "weren't", "haven't", "hasn't", "hadn't"]
-        
-        formal_count = sum(1 for word in words if word in formal_indicators)
-        informal_count = sum(1 for word in words if word in informal_indicators)
-        contraction_count = sum(1 for word in words if word in contractions)
+        formal_count = category_counts["formal"]
+        informal_count = category_counts["informal"]
+        contraction_count = category_counts["contractions"]
         
         # Check for complete sentences and proper capitalization
         proper_capitalization = message[0].isupper() if message else False
@@ -308,126 +502,102 @@ class StyleLearner:
         
         return formality_score
     
-    def _analyze_questions(self, message: str) -> Dict[str, any]:
-        """Analyze question patterns."""
-        questions = [s.strip() for s in re.split(r'[.!]', message) if '?' in s]
+    def _analyze_questions(self, message_lower: str) -> Dict[str, any]:
+        """Analyze question patterns in the lowercased message."""
+        questions = [s.strip() for s in _QUESTION_SPLIT_RE.split(message_lower) if '?' in s]
         
-        question_types = {
-            "yes_no": 0,
-            "open_ended": 0,
-            "rhetorical": 0
-        }
+        question_types = dict.fromkeys(self.QUESTION_TYPES, 0)
         
         for question in questions:
-            question_lower = question.lower()
-            
-            # Yes/no questions
-            if any(question_lower.startswith(word) for word in ["do", "does", "did", "is", "are", "was", "were", "can", "could", "will", "would", "should"]):
+            # Yes/no questions start with an auxiliary verb
+            first_word = question.split(maxsplit=1)[0].rstrip("?.,!")
+            if first_word in self.YES_NO_STARTERS:
                 question_types["yes_no"] += 1
             
-            # Open-ended questions
-            elif any(word in question_lower for word in ["what", "how", "why", "when", "where", "who"]):
+            # Open-ended questions contain a question word
+            elif not self.OPEN_QUESTION_WORDS.isdisjoint(_TOKEN_RE.findall(question)):
                 question_types["open_ended"] += 1
             
             # Rhetorical (harder to detect, simplified)
-            elif any(phrase in question_lower for phrase in ["right?", "you know?", "don't you think?"]):
+            elif any(phrase in question for phrase in self.RHETORICAL_PHRASES):
                 question_types["rhetorical"] += 1
         
         return {
             "total_questions": len(questions),
             "question_types": question_types,
-            "question_ratio": len(questions) / max(len(re.split(r'[.!?]', message)), 1)
+            "question_ratio": len(questions) / max(len(_SENTENCE_END_RE.split(message_lower)), 1)
         }
     
-    def _extract_topics(self, words: List[str]) -> List[str]:
+    def _extract_topics(self, word_counts: Counter) -> List[str]:
         """Extract potential topics of interest."""
-        # Simplified topic extraction
-        topic_categories = {
-            "technology": ["computer", "software", "app", "tech", "digital", "online", "internet", "ai", "programming"],
-            "work": ["job", "work", "career", "office", "business", "meeting", "project", "deadline"],
-            "relationships": ["friend", "family", "relationship", "dating", "marriage", "love", "partner"],
-            "hobbies": ["music", "movie", "book", "game", "sport", "art", "cooking", "travel"],
-            "health": ["health", "exercise", "diet", "sleep", "stress", "mental", "physical"],
-            "education": ["school", "college", "university", "study", "learn", "class", "degree"]
-        }
+        # Simplified topic extraction: one index lookup per distinct word
+        topic_index = self._TOPIC_INDEX
+        found = set()
+        for word in word_counts:
+            found.update(topic_index.get(word, ()))
         
-        detected_topics = []
-        for topic, keywords in topic_categories.items():
-            if any(keyword in words for keyword in keywords):
-                detected_topics.append(topic)
+        if not found:
+            return []
         
-        return detected_topics
+        # Report topics in declaration order
+        return [topic for topic in self.TOPIC_KEYWORDS if topic in found]
     
-    def _count_personal_references(self, words: List[str]) -> Dict[str, int]:
+    def _count_personal_references(self, word_counts: Counter) -> Dict[str, int]:
         """Count personal references in the message."""
         return {
-            "first_person": sum(1 for word in words if word in ["i", "me", "my", "myself", "mine"]),
-            "second_person": sum(1 for word in words if word in ["you", "your", "yours", "yourself"]),
-            "third_person": sum(1 for word in words if word in ["he", "she", "they", "them", "his", "her", "their"])
+            person: sum(word_counts[word] for word in references)
+            for person, references in self.PERSONAL_REFERENCES.items()
         }
     
     def _update_patterns(self, analysis: Dict[str, any]):
         """Update learned patterns based on new analysis."""
         # Simple exponential moving average to update patterns
-        alpha = 0.1  # Learning rate
-        
-        # Update vocabulary level
-        if "vocabulary_complexity" in analysis:
-            self.user_patterns["vocabulary_level"] = (
-                (1 - alpha) * self.user_patterns["vocabulary_level"] +
-                alpha * analysis["vocabulary_complexity"]
-            )
-        
-        # Update sentence length preference
-        if "avg_sentence_length" in analysis:
-            # Normalize sentence length to 0-1 scale
-            normalized_length = min(1.0, analysis["avg_sentence_length"] / 20.0)
-            self.user_patterns["sentence_length_preference"] = (
-                (1 - alpha) * self.user_patterns["sentence_length_preference"] +
-                alpha * normalized_length
-            )
-        
-        # Update emotional expressiveness
-        if "emotional_indicators" in analysis:
-            total_emotion = sum(analysis["emotional_indicators"].values())
-            self.user_patterns["emotional_expressiveness"] = (
-                (1 - alpha) * self.user_patterns["emotional_expressiveness"] +
-                alpha * min(1.0, total_emotion)
-            )
-        
-        # Update formality level
-        if "formality_indicators" in analysis:
-            formal_score = analysis["formality_indicators"]["formal_words"]
-            informal_score = analysis["formality_indicators"]["informal_words"]
-            
-            if formal_score + informal_score > 0:
-                formality_ratio = formal_score / (formal_score + informal_score)
-                self.user_patterns["formality_level"] = (
-                    (1 - alpha) * self.user_patterns["formality_level"] +
-                    alpha * formality_ratio
-                )
-        
-        # Update question frequency
-        if "question_patterns" in analysis:
-            self.user_patterns["question_frequency"] = (
-                (1 - alpha) * self.user_patterns["question_frequency"] +
-                alpha * analysis["question_patterns"]["question_ratio"]
-            )
+        patterns = self.user_patterns
+        alpha = self.LEARNING_RATE
+        retain = self._EMA_RETAIN
+        
+        # New observation for each numeric pattern; sentence length is
+        # normalized to a 0-1 scale
+        observations = [
+            ("vocabulary_level", analysis["vocabulary_complexity"]),
+            ("sentence_length_preference", min(1.0, analysis["avg_sentence_length"] / 20.0)),
+            ("emotional_expressiveness", min(1.0, sum(analysis["emotional_indicators"].values()))),
+            ("question_frequency", analysis["question_patterns"]["question_ratio"])
+        ]
+        
+        # Formality only moves when the message has formal or informal words
+        formal_score = analysis["formality_indicators"]["formal_words"]
+        informal_score = analysis["formality_indicators"]["informal_words"]
+        if formal_score + informal_score > 0:
+            observations.append(("formality_level", formal_score / (formal_score + informal_score)))
+        
+        for pattern, value in observations:
+            patterns[pattern] = retain * patterns[pattern] + alpha * value
         
         # Update topic interests
-        if "topics_mentioned" in analysis:
-            for topic in analysis["topics_mentioned"]:
-                if topic not in self.user_patterns["topic_interests"]:
-                    self.user_patterns["topic_interests"].append(topic)
+        patterns["topic_interests"].update(analysis["topics_mentioned"])
     
     def get_communication_summary(self) -> Dict[str, any]:
-        """Get a summary of learned communication patterns."""
-        return {
-            "patterns": self.user_patterns.copy(),
-            "messages_analyzed": len(self.message_history),
-            "confidence": min(1.0, len(self.message_history) / 20.0),  # Confidence increases with more data
-            "recent_trends": self._analyze_recent_trends()
-        }
+        """
+        Get a summary of learned communication patterns.
+        
+        Patterns only change when a message is learned from, so the summary
+        is rebuilt only after new messages. Callers always get their own
+        copy, so editing it doesn't affect the cached summary.
+        """
+        if self._summary_cache is None or self._summary_cache[0] != self.messages_analyzed:
+            self._summary_cache = (self.messages_analyzed, {
+                "patterns": {
+                    **self.user_patterns,
+                    # Sets aren't JSON serializable; report interests as a sorted list
+                    "topic_interests": sorted(self.user_patterns["topic_interests"])
+                },
+                "messages_analyzed": self.messages_analyzed,
+                "confidence": min(1.0, self.messages_analyzed / 20.0),  # Confidence increases with more data
+                "recent_trends": self._analyze_recent_trends()
+            })
+        
+        return _copy_analysis(self._summary_cache[1])
     
     def _analyze_recent_trends(self) -> Dict[str, str]:
         """Analyze recent trends in communication style."""
@@ -435,7 +605,7 @@ class StyleLearner:
             return {"trend": "insufficient_data"}
         
         # Compare recent messages to overall patterns
-        recent_messages = self.message_history[-5:]
+        recent_messages = list(islice(self.message_history, len(self.message_history) - 5, None))
         
         trends = {}
         
@@ -467,9 +637,8 @@ class StyleLearner:
         # Adjust formality
         if self.user_patterns["formality_level"] < 0.3:
             # Make more casual
-            adapted_response = adapted_response.replace("I would", "I'd")
-            adapted_response = adapted_response.replace("cannot", "can't")
-            adapted_response = adapted_response.replace("do not", "don't")
+            casual = self.CASUAL_REPLACEMENTS
+            adapted_response = self._CASUAL_RE.sub(lambda m: casual[m.group(0)], adapted_response)
         
         # Adjust enthusiasm based on user's emotional expressiveness
         if self.user_patterns["emotional_expressiveness"] > 0.7:
@@ -480,15 +649,7 @@ class StyleLearner:
         # Adjust complexity based on vocabulary level
         if self.user_patterns["vocabulary_level"] < 0.3:
             # Simplify language (basic implementation)
-            complex_words = {
-                "utilize": "use",
-                "facilitate": "help",
-                "demonstrate": "show",
-                "approximately": "about",
-                "subsequently": "then"
-            }
-            
-            for complex_word, simple_word in complex_words.items():
-                adapted_response = adapted_response.replace(complex_word, simple_word)
+            simple = self.SIMPLE_REPLACEMENTS
+            adapted_response = self._SIMPLIFY_RE.sub(lambda m: simple[m.group(0)], adapted_response)
         
         return adapted_response
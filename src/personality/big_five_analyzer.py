@@ -6,9 +6,186 @@ this module analyzes text to identify personality traits and patterns.
 """
 
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, FrozenSet, List, Tuple
 from collections import Counter
-import math
+from functools import lru_cache
+
+
+# Compiled once at import; the token pattern itself skips words shorter than
+# three characters
+_TOKEN_RE = re.compile(r'\b\w{3,}\b')
+# Sentence-ending punctuation runs, and the whitespace separated words between
+# them (the same words str.split() finds in each sentence)
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+_SENTENCE_WORD_RE = re.compile(r'[^\s.!?]+')
+
+def _load_trait_indicators() -> Dict[str, Dict[str, FrozenSet[str]]]:
+    """
+    Load linguistic indicators for each Big Five trait.
+    
+    These are based on research into language patterns that correlate
+    with personality traits. Each list is frozen into a set so word
+    lookups are hashed.
+    """
+    indicators = {
+        "openness": {
+            "high": [
+                # Creativity and imagination words
+                "creative", "imagine", "artistic", "innovative", "original",
+                "abstract", "theoretical", "philosophical", "metaphor",
+                "possibility", "potential", "explore", "discover",
+                # Intellectual curiosity
+                "wonder", "curious", "fascinating", "intriguing", "complex",
+                "analyze", "understand", "learn", "study", "research",
+                # Openness to experience
+                "adventure", "travel", "culture", "different", "unique",
+                "experiment", "try", "experience", "new", "novel"
+            ],
+            "low": [
+                # Conventional thinking
+                "traditional", "conventional", "normal", "standard", "typical",
+                "practical", "realistic", "concrete", "simple", "basic",
+                # Resistance to change
+                "always", "never", "same", "routine", "habit", "usual",
+                "predictable", "stable", "consistent", "reliable"
+            ]
+        },
+        
+        "conscientiousness": {
+            "high": [
+                # Organization and planning
+                "organize", "plan", "schedule", "prepare", "arrange",
+                "systematic", "methodical", "structured", "ordered",
+                # Goal orientation
+                "goal", "achieve", "accomplish", "complete", "finish",
+                "success", "work", "effort", "discipline", "focus",
+                # Responsibility
+                "responsible", "duty", "obligation", "commitment", "promise",
+                "reliable", "dependable", "punctual", "thorough"
+            ],
+            "low": [
+                # Disorganization
+                "messy", "chaotic", "disorganized", "scattered", "random",
+                "spontaneous", "impulsive", "careless", "lazy",
+                # Procrastination
+                "later", "tomorrow", "eventually", "postpone", "delay",
+                "forget", "ignore", "skip", "avoid", "procrastinate"
+            ]
+        },
+        
+        "extraversion": {
+            "high": [
+                # Social orientation
+                "people", "friends", "party", "social", "group", "team",
+                "together", "meet", "talk", "chat", "conversation",
+                # Energy and assertiveness
+                "excited", "energetic", "enthusiastic", "confident", "bold",
+                "outgoing", "talkative", "loud", "active", "lively",
+                # Leadership
+                "lead", "direct", "manage", "control", "influence", "persuade"
+            ],
+            "low": [
+                # Introversion
+                "quiet", "alone", "solitude", "private", "reserved", "shy",
+                "introverted", "withdrawn", "isolated", "independent",
+                # Preference for smaller groups
+                "few", "small", "intimate", "close", "personal", "individual",
+                # Thoughtful communication
+                "think", "reflect", "consider", "ponder", "contemplate"
+            ]
+        },
+        
+        "agreeableness": {
+            "high": [
+                # Cooperation and empathy
+                "help", "support", "care", "kind", "compassionate", "empathy",
+                "understanding", "sympathetic", "considerate", "thoughtful",
+                # Trust and harmony
+                "trust", "believe", "faith", "harmony", "peace", "cooperation",
+                "agree", "compromise", "collaborate", "share", "give",
+                # Positive regard for others
+                "love", "like", "appreciate", "respect", "admire", "value"
+            ],
+            "low": [
+                # Competitiveness and skepticism
+                "compete", "win", "beat", "defeat", "superior", "better",
+                "skeptical", "doubt", "suspicious", "distrust", "question",
+                # Self-focus
+                "myself", "my", "me", "I", "selfish", "independent",
+                # Critical attitudes
+                "wrong", "stupid", "annoying", "irritating", "hate", "dislike"
+            ]
+        },
+        
+        "neuroticism": {
+            "high": [
+                # Anxiety and worry
+                "anxious", "worried", "nervous", "stress", "tension", "fear",
+                "panic", "overwhelmed", "pressure", "burden", "struggle",
+                # Negative emotions
+                "sad", "depressed", "upset", "angry", "frustrated", "irritated",
+                "disappointed", "hurt", "pain", "suffering", "miserable",
+                # Emotional instability
+                "emotional", "sensitive", "moody", "unstable", "volatile",
+                "dramatic", "intense", "extreme", "overreact"
+            ],
+            "low": [
+                # Emotional stability
+                "calm", "relaxed", "peaceful", "stable", "steady", "balanced",
+                "composed", "controlled", "even", "consistent", "secure",
+                # Positive emotions
+                "happy", "content", "satisfied", "pleased", "comfortable",
+                "confident", "optimistic", "positive", "cheerful", "joyful",
+                # Resilience
+                "cope", "handle", "manage", "deal", "overcome", "resilient"
+            ]
+        }
+    }
+    
+    return {
+        trait: {polarity: frozenset(words) for polarity, words in lists.items()}
+        for trait, lists in indicators.items()
+    }
+
+def _build_word_buckets(traits: Tuple[str, ...],
+                        trait_indicators: Dict[str, Dict[str, FrozenSet[str]]],
+                        lexicons: Tuple[FrozenSet[str], ...]) -> Dict[str, Tuple[int, ...]]:
+    """
+    Map each indicator word to its match bucket indices.
+    
+    Trait ``i`` (in ``traits`` order) counts high matches in bucket
+    ``2 * i`` and low matches in bucket ``2 * i + 1``. Lexicon ``j`` then
+    counts its words in bucket ``2 * len(traits) + j``. A word listed in
+    several places maps to several buckets.
+    """
+    buckets = {}
+    for i, trait in enumerate(traits):
+        indicators = trait_indicators[trait]
+        for offset, polarity in enumerate(("high", "low")):
+            for word in indicators[polarity]:
+                buckets.setdefault(word, []).append(2 * i + offset)
+    
+    for j, lexicon in enumerate(lexicons, 2 * len(traits)):
+        for word in lexicon:
+            buckets.setdefault(word, []).append(j)
+    
+    return {word: tuple(indices) for word, indices in buckets.items()}
+
+# Word lists for the linguistic features
+_FIRST_PERSON_WORDS = frozenset({'i', 'me', 'my', 'myself', 'mine'})
+_POSITIVE_WORDS = frozenset({'good', 'great', 'awesome', 'amazing', 'wonderful', 'excellent', 'fantastic', 'love', 'like', 'enjoy', 'happy', 'pleased'})
+_NEGATIVE_WORDS = frozenset({'bad', 'terrible', 'awful', 'horrible', 'hate', 'dislike', 'angry', 'sad', 'upset', 'frustrated', 'annoyed'})
+
+# Indicator tables are immutable, so they are built once and shared by all
+# analyzers. The feature lexicons get buckets after the traits so a single
+# pass over the words counts everything.
+_TRAIT_INDICATORS = _load_trait_indicators()
+_TRAITS = tuple(_TRAIT_INDICATORS)
+_TRAIT_BUCKETS = 2 * len(_TRAITS)
+_WORD_BUCKETS = _build_word_buckets(
+    _TRAITS, _TRAIT_INDICATORS, (_FIRST_PERSON_WORDS, _POSITIVE_WORDS, _NEGATIVE_WORDS))
+_FIRST_PERSON_BUCKET, _POSITIVE_BUCKET, _NEGATIVE_BUCKET = range(_TRAIT_BUCKETS, _TRAIT_BUCKETS + 3)
+_BUCKET_COUNT = _TRAIT_BUCKETS + 3
 
 
 class BigFiveAnalyzer:
@@ -23,132 +200,25 @@ class BigFiveAnalyzer:
     - Neuroticism: emotional instability, anxiety, negative emotions
     """
     
+    # Fixed attribute layout; analyzers carry no per-instance __dict__
+    __slots__ = (
+        "trait_indicators",
+        "_traits",
+        "_word_buckets",
+        "_cached_scores"
+    )
+    
     def __init__(self):
         """Initialize the analyzer with trait indicators."""
-        self.trait_indicators = self._load_trait_indicators()
+        self.trait_indicators = _TRAIT_INDICATORS
         
-    def _load_trait_indicators(self) -> Dict[str, Dict[str, List[str]]]:
-        """
-        Load linguistic indicators for each Big Five trait.
+        # Every indicator word mapped to the match buckets it counts towards
+        self._traits = _TRAITS
+        self._word_buckets = _WORD_BUCKETS
+        
+        # Scoring is pure, so repeated texts reuse their earlier scores
+        self._cached_scores = lru_cache(maxsize=512)(self._score_text)
         
-        These are based on research into language patterns that correlate
-        with personality traits.
-        """
-        return {
-            "openness": {
-                "high": [
-                    # Creativity and imagination words
-                    "creative", "imagine", "artistic", "innovative", "original",
-                    "abstract", "theoretical", "philosophical", "metaphor",
-                    "possibility", "potential", "explore", "discover",
-                    # Intellectual curiosity
-                    "wonder", "curious", "fascinating", "intriguing", "complex",
-                    "analyze", "understand", "learn", "study", "research",
-                    # Openness to experience
-                    "adventure", "travel", "culture", "different", "unique",
-                    "experiment", "try", "experience", "new", "novel"
-                ],
-                "low": [
-                    # Conventional thinking
-                    "traditional", "conventional", "normal", "standard", "typical",
-                    "practical", "realistic", "concrete", "simple", "basic",
-                    # Resistance to change
-                    "always", "never", "same", "routine", "habit", "usual",
-                    "predictable", "stable", "consistent", "reliable"
-                ]
-            },
-            
-            "conscientiousness": {
-                "high": [
-                    # Organization and planning
-                    "organize", "plan", "schedule", "prepare", "arrange",
-                    "systematic", "methodical", "structured", "ordered",
-                    # Goal orientation
-                    "goal", "achieve", "accomplish", "complete", "finish",
-                    "success", "work", "effort", "discipline", "focus",
-                    # Responsibility
-                    "responsible", "duty", "obligation", "commitment", "promise",
-                    "reliable", "dependable", "punctual", "thorough"
-                ],
-                "low": [
-                    # Disorganization
-                    "messy", "chaotic", "disorganized", "scattered", "random",
-                    "spontaneous", "impulsive", "careless", "lazy",
-                    # Procrastination
-                    "later", "tomorrow", "eventually", "postpone", "delay",
-                    "forget", "ignore", "skip", "avoid", "procrastinate"
-                ]
-            },
-            
-            "extraversion": {
-                "high": [
-                    # Social orientation
-                    "people", "friends", "party", "social", "group", "team",
-                    "together", "meet", "talk", "chat", "conversation",
-                    # Energy and assertiveness
-                    "excited", "energetic", "enthusiastic", "confident", "bold",
-                    "outgoing", "talkative", "loud", "active", "lively",
-                    # Leadership
-                    "lead", "direct", "manage", "control", "influence", "persuade"
-                ],
-                "low": [
-                    # Introversion
-                    "quiet", "alone", "solitude", "private", "reserved", "shy",
-                    "introverted", "withdrawn", "isolated", "independent",
-                    # Preference for smaller groups
-                    "few", "small", "intimate", "close", "personal", "individual",
-                    # Thoughtful communication
-                    "think", "reflect", "consider", "ponder", "contemplate"
-                ]
-            },
-            
-            "agreeableness": {
-                "high": [
-                    # Cooperation and empathy
-                    "help", "support", "care", "kind", "compassionate", "empathy",
-                    "understanding", "sympathetic", "considerate", "thoughtful",
-                    # Trust and harmony
-                    "trust", "believe", "faith", "harmony", "peace", "cooperation",
-                    "agree", "compromise", "collaborate", "share", "give",
-                    # Positive regard for others
-                    "love", "like", "appreciate", "respect", "admire", "value"
-                ],
-                "low": [
-                    # Competitiveness and skepticism
-                    "compete", "win", "beat", "defeat", "superior", "better",
-                    "skeptical", "doubt", "suspicious", "distrust", "question",
-                    # Self-focus
-                    "myself", "my", "me", "I", "selfish", "independent",
-                    # Critical attitudes
-                    "wrong", "stupid", "annoying", "irritating", "hate", "dislike"
-                ]
-            },
-            
-            "neuroticism": {
-                "high": [
-                    # Anxiety and worry
-                    "anxious", "worried", "nervous", "stress", "tension", "fear",
-                    "panic", "overwhelmed", "pressure", "burden", "struggle",
-                    # Negative emotions
-                    "sad", "depressed", "upset", "angry", "frustrated", "irritated",
-                    "disappointed", "hurt", "pain", "suffering", "miserable",
-                    # Emotional instability
-                    "emotional", "sensitive", "moody", "unstable", "volatile",
-                    "dramatic", "intense", "extreme", "overreact"
-                ],
-                "low": [
-                    # Emotional stability
-                    "calm", "relaxed", "peaceful", "stable", "steady", "balanced",
-                    "composed", "controlled", "even", "consistent", "secure",
-                    # Positive emotions
-                    "happy", "content", "satisfied", "pleased", "comfortable",
-                    "confident", "optimistic", "positive", "cheerful", "joyful",
-                    # Resilience
-                    "cope", "handle", "manage", "deal", "overcome", "resilient"
-                ]
-            }
-        }
-    
     def analyze_text(self, text: str) -> Dict[str, float]:
         """
         Analyze text for Big Five personality indicators.
@@ -159,78 +229,114 @@ class BigFiveAnalyzer:
         Returns:
             Dictionary with scores for each trait (0.0 to 1.0)
         """
-        # Clean and tokenize text
-        words = self._tokenize(text.lower())
+        return self.analyze_texts([text])[0]
+    
+    def analyze_texts(self, texts: List[str]) -> List[Dict[str, float]]:
+        """
+        Analyze several texts for Big Five personality indicators in one call.
+        
+        Each text is tokenized and scored against all traits in a single
+        pass over its distinct words. Scores for recently seen texts are
+        served from a cache.
+        
+        Args:
+            texts: The texts to analyze
+            
+        Returns:
+            List of score dictionaries, one per text, in input order
+        """
+        cached_scores = self._cached_scores
+        # Copies, so callers can't modify the cached scores
+        return [cached_scores(text).copy() for text in texts]
+    
+    def _score_text(self, text: str) -> Dict[str, float]:
+        """Score a single text against all trait indicators and features."""
+        # Tokenize text into lowercase words
+        words = self._tokenize(text)
         word_count = len(words)
         
         if word_count == 0:
             return self._default_scores()
         
-        scores = {}
+        # Instance lookups bound to locals once per text
+        traits = self._traits
+        word_buckets = self._word_buckets
         
-        for trait in self.trait_indicators:
-            high_indicators = self.trait_indicators[trait]["high"]
-            low_indicators = self.trait_indicators[trait]["low"]
-            
-            # Count matches
-            high_matches = sum(1 for word in words if word in high_indicators)
-            low_matches = sum(1 for word in words if word in low_indicators)
-            
-            # Calculate trait score
-            if high_matches + low_matches == 0:
-                scores[trait] = 0.5  # Neutral if no indicators
-            else:
-                # Score based on ratio of high to total indicators
-                trait_score = high_matches / (high_matches + low_matches)
-                scores[trait] = trait_score
+        # Count each distinct word once, then add it to every bucket it feeds
+        word_counts = Counter(words)
+        matches = [0] * _BUCKET_COUNT
+        # Intersecting the key views drops non-indicator words in C, so the
+        # Python loop only runs for words that actually score
+        for word in word_buckets.keys() & word_counts.keys():
+            count = word_counts[word]
+            for bucket in word_buckets[word]:
+                matches[bucket] += count
+        
+        # Each trait scores the ratio of high to total indicator matches,
+        # or neutral 0.5 if the text has none of its indicators
+        scores = {
+            trait: high_matches / (high_matches + low_matches) if high_matches + low_matches else 0.5
+            for trait, high_matches, low_matches in zip(
+                traits, matches[0:_TRAIT_BUCKETS:2], matches[1:_TRAIT_BUCKETS:2])
+        }
         
         # Add additional linguistic analysis
-        linguistic_features = self._analyze_linguistic_features(text, words)
+        linguistic_features = self._analyze_linguistic_features(text, words, matches)
         scores.update(linguistic_features)
         
         return scores
     
     def _tokenize(self, text: str) -> List[str]:
-        """Simple tokenization - split on non-alphanumeric characters."""
-        return [word for word in re.findall(r'\b\w+\b', text) if len(word) > 2]
+        """
+        Simple tokenization - words of three or more alphanumeric characters.
+        
+        Tokens are lowercased individually, so long texts are not copied
+        whole just to lowercase them.
+        """
+        return list(map(str.lower, _TOKEN_RE.findall(text)))
     
-    def _analyze_linguistic_features(self, text: str, words: List[str]) -> Dict[str, float]:
+    def _analyze_linguistic_features(self, text: str, words: List[str], matches: List[int]) -> Dict[str, float]:
         """
         Analyze additional linguistic features that correlate with personality.
         
         Args:
             text: Original text
-            words: Tokenized words
+            words: Tokenized words (never empty)
+            matches: Bucket totals from _score_text, including the first
+                person and sentiment word counts
             
         Returns:
             Additional personality indicators
         """
+        # Ratios are capped at 1.0 with inline comparisons rather than min()
         features = {}
         
+        # The text splits into one more sentence than it has punctuation runs;
+        # every '?' and '!' in the text is inside one of those runs
+        end_runs = _SENTENCE_END_RE.findall(text)
+        sentence_count = len(end_runs) + 1
+        end_marks = "".join(end_runs)
+        
         # Sentence length and complexity (Openness indicator)
-        sentences = re.split(r'[.!?]+', text)
-        avg_sentence_length = sum(len(s.split()) for s in sentences if s.strip()) / max(len(sentences), 1)
-        features["linguistic_complexity"] = min(1.0, avg_sentence_length / 20.0)
+        complexity = len(_SENTENCE_WORD_RE.findall(text)) / sentence_count / 20.0
+        features["linguistic_complexity"] = complexity if complexity < 1.0 else 1.0
         
         # Question usage (Openness/Curiosity)
-        question_count = text.count('?')
-        features["curiosity_indicators"] = min(1.0, question_count / max(len(sentences), 1))
+        curiosity = end_marks.count('?') / sentence_count
+        features["curiosity_indicators"] = curiosity if curiosity < 1.0 else 1.0
         
         # Exclamation usage (Extraversion)
-        exclamation_count = text.count('!')
-        features["enthusiasm_indicators"] = min(1.0, exclamation_count / max(len(sentences), 1))
+        enthusiasm = end_marks.count('!') / sentence_count
+        features["enthusiasm_indicators"] = enthusiasm if enthusiasm < 1.0 else 1.0
         
         # First person pronouns (potential Neuroticism indicator)
-        first_person = ['i', 'me', 'my', 'myself', 'mine']
-        first_person_count = sum(1 for word in words if word in first_person)
-        features["self_focus"] = min(1.0, first_person_count / max(len(words), 1) * 10)
+        first_person_count = matches[_FIRST_PERSON_BUCKET]
+        self_focus = first_person_count / len(words) * 10
+        features["self_focus"] = self_focus if self_focus < 1.0 else 1.0
         
         # Positive vs negative sentiment words (Agreeableness/Neuroticism)
-        positive_words = ['good', 'great', 'awesome', 'amazing', 'wonderful', 'excellent', 'fantastic', 'love', 'like', 'enjoy', 'happy', 'pleased']
-        negative_words = ['bad', 'terrible', 'awful', 'horrible', 'hate', 'dislike', 'angry', 'sad', 'upset', 'frustrated', 'annoyed']
-        
-        positive_count = sum(1 for word in words if word in positive_words)
-        negative_count = sum(1 for word in words if word in negative_words)
+        positive_count = matches[_POSITIVE_BUCKET]
+        negative_count = matches[_NEGATIVE_BUCKET]
         
         if positive_count + negative_count > 0:
             features["sentiment_ratio"] = positive_count / (positive_count + negative_count)
@@ -295,30 +401,35 @@ class BigFiveAnalyzer:
         """
         complementary = {}
         
-        for trait, user_score in user_scores.items():
-            if trait in self.trait_indicators:  # Main Big Five traits
-                if trait == "agreeableness":
-                    # Ren should always be reasonably agreeable
-                    complementary[trait] = max(0.7, user_score)
-                elif trait == "neuroticism":
-                    # Ren should be emotionally stable to balance user's emotions
-                    complementary[trait] = max(0.2, 1.0 - user_score * 0.8)
-                elif trait == "openness":
-                    # If user is very open, Ren can be slightly more grounded
-                    # If user is closed, Ren should encourage exploration
-                    if user_score > 0.7:
-                        complementary[trait] = 0.6
-                    elif user_score < 0.3:
-                        complementary[trait] = 0.8
-                    else:
-                        complementary[trait] = 0.7
+        # Only the main Big Five traits are complemented; the linguistic
+        # features in user_scores are never visited
+        for trait in self._traits:
+            if trait not in user_scores:
+                continue
+            user_score = user_scores[trait]
+            
+            if trait == "agreeableness":
+                # Ren should always be reasonably agreeable
+                complementary[trait] = max(0.7, user_score)
+            elif trait == "neuroticism":
+                # Ren should be emotionally stable to balance user's emotions
+                complementary[trait] = max(0.2, 1.0 - user_score * 0.8)
+            elif trait == "openness":
+                # If user is very open, Ren can be slightly more grounded
+                # If user is closed, Ren should encourage exploration
+                if user_score > 0.7:
+                    complementary[trait] = 0.6
+                elif user_score < 0.3:
+                    complementary[trait] = 0.8
+                else:
+                    complementary[trait] = 0.7
+            else:
+                # For other traits, aim for slight complementarity
+                if user_score > 0.6:
+                    complementary[trait] = user_score - 0.2
+                elif user_score < 0.4:
+                    complementary[trait] = user_score + 0.2
                 else:
-                    # For other traits, aim for slight complementarity
-                    if user_score > 0.6:
-                        complementary[trait] = user_score - 0.2
-                    elif user_score < 0.4:
-                        complementary[trait] = user_score + 0.2
-                    else:
-                        complementary[trait] = user_score
+                    complementary[trait] = user_score
         
         return complementary
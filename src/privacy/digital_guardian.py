@@ -5,15 +5,111 @@ This module helps users understand and protect their digital privacy by
 researching their online presence and providing actionable recommendations.
 """
 
-import requests
-from typing import Dict, List, Optional, Tuple
-import re
+from typing import Dict, List
+from collections import defaultdict
+import string
 import time
-from urllib.parse import quote_plus
-import json
 from datetime import datetime
 
 
+# General recommendations given to every user, ahead of finding-specific ones.
+# Callers only ever receive copies of these.
+_GENERAL_RECOMMENDATIONS = (
+    {
+        "category": "general",
+        "title": "Review Social Media Privacy Settings",
+        "description": "Check privacy settings on all social media platforms to limit public visibility of personal information.",
+        "priority": "high",
+        "difficulty": "easy"
+    },
+    {
+        "category": "general",
+        "title": "Google Yourself Regularly",
+        "description": "Search for your name regularly to monitor what information is publicly available about you.",
+        "priority": "medium",
+        "difficulty": "easy"
+    },
+    {
+        "category": "data_brokers",
+        "title": "Opt Out of Data Broker Sites",
+        "description": "Request removal of your information from data broker websites that collect and sell personal data.",
+        "priority": "high",
+        "difficulty": "medium"
+    },
+    {
+        "category": "passwords",
+        "title": "Use Strong, Unique Passwords",
+        "description": "Use a password manager to create and store strong, unique passwords for all accounts.",
+        "priority": "high",
+        "difficulty": "easy"
+    },
+    {
+        "category": "two_factor",
+        "title": "Enable Two-Factor Authentication",
+        "description": "Add an extra layer of security to important accounts with two-factor authentication.",
+        "priority": "high",
+        "difficulty": "easy"
+    }
+)
+
+
+# Privacy action plan for each time commitment level
+_PLAN_TABLE = {
+    "low": {
+        "immediate": (
+            "Review Facebook privacy settings (10 minutes)",
+            "Enable two-factor authentication on email (5 minutes)"
+        ),
+        "weekly": (),
+        "monthly": (),
+        "time": "15 minutes"
+    },
+    "medium": {
+        "immediate": (),
+        "weekly": (),
+        "monthly": (),
+        "time": "0 minutes"
+    },
+    "high": {
+        "immediate": (
+            "Complete privacy audit of all social media accounts (30 minutes)",
+            "Set up password manager and update passwords (45 minutes)",
+            "Opt out of major data broker sites (60 minutes)"
+        ),
+        "weekly": (),
+        "monthly": (),
+        "time": "2 hours 15 minutes"
+    }
+}
+
+
+# Privacy report sections, filled in by generate_privacy_report()
+_REPORT_HEADER = string.Template("""
+# Digital Privacy Report for $name
+
+## Summary
+$summary
+
+## Overall Privacy Risk: $risk
+
+## Findings ($total items found)
+
+""")
+
+_FINDING_TPL = string.Template("""
+### $idx. $platform $emoji
+- **Type:** $type
+- **Content:** $content
+- **Privacy Risk:** $risk
+- **Recommendation:** $recommendation
+
+""")
+
+_RECOMMENDATION_TPL = string.Template(
+    "$idx. **$title**\n   $description\n   *Difficulty: $difficulty*\n\n"
+)
+
+
 class DigitalGuardian:
     """
     Protects user privacy by researching their digital footprint and
@@ -23,37 +119,63 @@ class DigitalGuardian:
     but uses their powers to help you stay safe and private.
     """
     
+    # Search endpoints; the query is appended URL-encoded
+    SEARCH_ENGINES = (
+        "https://www.google.com/search?q=",
+        "https://duckduckgo.com/?q=",
+        "https://www.bing.com/search?q="
+    )
+    
+    # Social sites searched for the user's name
+    SOCIAL_PLATFORMS = (
+        "facebook.com",
+        "instagram.com",
+        "twitter.com",
+        "linkedin.com",
+        "tiktok.com",
+        "snapchat.com",
+        "youtube.com",
+        "reddit.com",
+        "pinterest.com"
+    )
+    
+    # People-search sites that commonly list personal details
+    DATA_BROKER_SITES = (
+        "whitepages.com",
+        "spokeo.com",
+        "peoplefinder.com",
+        "intelius.com",
+        "beenverified.com",
+        "truthfinder.com"
+    )
+    
+    # Words searched together with the quoted name: professional, then educational
+    NAME_CONTEXT_TERMS = ("linkedin", "resume", "CV", "university", "college", "school")
+    
+    # Report marker for each privacy risk level; unknown levels show as low
+    RISK_EMOJI = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+    
+    # How long research results stay valid for an identical set of queries
+    RESEARCH_TTL_SECONDS = 24 * 60 * 60
+    
     def __init__(self):
         """Initialize the Digital Guardian."""
-        self.search_engines = [
-            "https://www.google.com/search?q=",
-            "https://duckduckgo.com/?q=",
-            "https://www.bing.com/search?q="
-        ]
+        self.research_results = []
+        self.privacy_risks = []
         
-        self.social_platforms = [
-            "facebook.com",
-            "instagram.com", 
-            "twitter.com",
-            "linkedin.com",
-            "tiktok.com",
-            "snapchat.com",
-            "youtube.com",
-            "reddit.com",
-            "pinterest.com"
-        ]
+        # research_results bucketed by privacy_risk
+        self._by_risk = {}
         
-        self.data_broker_sites = [
-            "whitepages.com",
-            "spokeo.com",
-            "peoplefinder.com",
-            "intelius.com",
-            "beenverified.com",
-            "truthfinder.com"
-        ]
+        # Derived from the current findings; reset by _assess_privacy_risks()
+        self._recommendations_cache = None
+        self._summary_cache = None
         
-        self.research_results = []
-        self.privacy_risks = []
+        # Queries from start_research() that haven't been processed yet
+        self._pending_queries = None
+        
+        # Queries behind the current research_results, and when they ran
+        self._researched_queries = None
+        self._researched_at = 0.0
         
     def start_research(self, user_info: Dict[str, str]) -> Dict[str, str]:
         """
@@ -78,12 +200,35 @@ class DigitalGuardian:
             "message": "I'm starting to research your digital presence. This will help me understand what information about you is publicly available and identify potential privacy risks."
         }
         
-        # In a real implementation, this would run asynchronously
-        # For now, we'll simulate the process
-        self._simulate_research_process(search_queries)
+        # The research itself is deferred until results are requested, so
+        # starting it stays cheap
+        self._pending_queries = search_queries
         
         return research_status
     
+    def _ensure_research(self) -> None:
+        """
+        Run any research started with start_research() that hasn't run yet.
+        
+        Research for the same queries within RESEARCH_TTL_SECONDS reuses the
+        existing results instead of searching again.
+        """
+        if self._pending_queries is None:
+            return
+        
+        queries = self._pending_queries
+        now = time.time()
+        if queries == self._researched_queries and now - self._researched_at < self.RESEARCH_TTL_SECONDS:
+            self._pending_queries = None
+            return
+        
+        # Only mark the queries as handled once research has succeeded, so a
+        # failed run is retried on the next read
+        self._simulate_research_process(queries)
+        self._researched_queries = queries
+        self._researched_at = now
+        self._pending_queries = None
+    
     def _generate_search_queries(self, user_info: Dict[str, str]) -> List[str]:
         """
         Generate search queries to research the user's digital footprint.
@@ -94,47 +239,50 @@ class DigitalGuardian:
         Returns:
             List of search queries to execute
         """
-        queries = []
-        
         name = user_info.get("name", "")
         age = user_info.get("age", "")
         location = user_info.get("location", "")
         
-        if name:
-            # Basic name searches
-            queries.append(f'"{name}"')
-            queries.append(f'{name}')
-            
-            # Name with location
-            if location:
-                queries.append(f'"{name}" {location}')
-                queries.append(f'{name} {location}')
-            
-            # Name with age context
-            if age:
-                current_year = datetime.now().year
-                birth_year = current_year - int(age)
-                queries.append(f'"{name}" {birth_year}')
-                queries.append(f'{name} born {birth_year}')
-            
-            # Social media specific searches
-            for platform in self.social_platforms:
-                queries.append(f'site:{platform} "{name}"')
-                queries.append(f'site:{platform} {name}')
-            
-            # Professional searches
-            queries.append(f'"{name}" linkedin')
-            queries.append(f'"{name}" resume')
-            queries.append(f'"{name}" CV')
-            
-            # Educational searches
-            queries.append(f'"{name}" university')
-            queries.append(f'"{name}" college')
-            queries.append(f'"{name}" school')
-            
-            # Data broker searches
-            for broker in self.data_broker_sites:
-                queries.append(f'site:{broker} "{name}"')
+        if not name:
+            return []
+        
+        queries = []
+        seen = set()
+        
+        def add(*candidates):
+            # Search engines ignore case, so queries differing only in case
+            # are duplicates; keep the first one
+            for query in candidates:
+                key = query.lower()
+                if key not in seen:
+                    seen.add(key)
+                    queries.append(query)
+        
+        # Basic name searches
+        add(f'"{name}"', f'{name}')
+        
+        # Name with location
+        if location:
+            add(f'"{name}" {location}', f'{name} {location}')
+        
+        # Name with age context; an age that isn't a whole number is skipped
+        # rather than aborting the whole search
+        try:
+            birth_year = datetime.now().year - int(age) if age else None
+        except (TypeError, ValueError):
+            birth_year = None
+        if birth_year is not None:
+            add(f'"{name}" {birth_year}', f'{name} born {birth_year}')
+        
+        # Social media specific searches, quoted and unquoted per platform
+        for platform in self.SOCIAL_PLATFORMS:
+            add(f'site:{platform} "{name}"', f'site:{platform} {name}')
+        
+        # Professional and educational searches
+        add(*(f'"{name}" {term}' for term in self.NAME_CONTEXT_TERMS))
+        
+        # Data broker searches
+        add(*(f'site:{broker} "{name}"' for broker in self.DATA_BROKER_SITES))
         
         return queries
     
@@ -185,15 +333,28 @@ class DigitalGuardian:
         ]
         
         # Store simulated results
-        self.research_results = simulated_findings
+        self.research_results = []
+        self._by_risk = {}
+        for finding in simulated_findings:
+            self._add_finding(finding)
         
         # Generate privacy risk assessment
         self._assess_privacy_risks()
     
+    def _add_finding(self, finding: Dict[str, str]) -> None:
+        """Record a research finding and index it by risk level."""
+        self.research_results.append(finding)
+        self._by_risk.setdefault(finding["privacy_risk"], []).append(finding)
+    
     def _assess_privacy_risks(self) -> None:
         """Assess privacy risks based on research findings."""
-        high_risk_count = sum(1 for result in self.research_results if result["privacy_risk"] == "high")
-        medium_risk_count = sum(1 for result in self.research_results if result["privacy_risk"] == "medium")
+        # Runs whenever research_results change, so drop anything derived
+        # from the previous findings
+        self._recommendations_cache = None
+        self._summary_cache = None
+        
+        high_risk_count = len(self._by_risk.get("high", ()))
+        medium_risk_count = len(self._by_risk.get("medium", ()))
         
         overall_risk = "low"
         if high_risk_count > 0:
@@ -215,6 +376,8 @@ class DigitalGuardian:
         Returns:
             Dictionary containing research findings and recommendations
         """
+        self._ensure_research()
+        
         return {
             "findings": self.research_results,
             "privacy_assessment": self.privacy_risks,
@@ -223,53 +386,18 @@ class DigitalGuardian:
         }
     
     def _generate_recommendations(self) -> List[Dict[str, str]]:
-        """Generate actionable privacy recommendations."""
-        recommendations = []
-        
-        # General recommendations
-        recommendations.append({
-            "category": "general",
-            "title": "Review Social Media Privacy Settings",
-            "description": "Check privacy settings on all social media platforms to limit public visibility of personal information.",
-            "priority": "high",
-            "difficulty": "easy"
-        })
-        
-        recommendations.append({
-            "category": "general", 
-            "title": "Google Yourself Regularly",
-            "description": "Search for your name regularly to monitor what information is publicly available about you.",
-            "priority": "medium",
-            "difficulty": "easy"
-        })
-        
-        recommendations.append({
-            "category": "data_brokers",
-            "title": "Opt Out of Data Broker Sites",
-            "description": "Request removal of your information from data broker websites that collect and sell personal data.",
-            "priority": "high",
-            "difficulty": "medium"
-        })
-        
-        recommendations.append({
-            "category": "passwords",
-            "title": "Use Strong, Unique Passwords",
-            "description": "Use a password manager to create and store strong, unique passwords for all accounts.",
-            "priority": "high",
-            "difficulty": "easy"
-        })
-        
-        recommendations.append({
-            "category": "two_factor",
-            "title": "Enable Two-Factor Authentication",
-            "description": "Add an extra layer of security to important accounts with two-factor authentication.",
-            "priority": "high",
-            "difficulty": "easy"
-        })
-        
-        # Specific recommendations based on findings
-        for finding in self.research_results:
-            if finding["privacy_risk"] == "high":
+        """
+        Generate actionable privacy recommendations.
+        
+        Each call returns a new list of new dicts, so callers can't alter
+        the cached recommendations or the shared general ones.
+        """
+        if self._recommendations_cache is None:
+            # General recommendations first, then any specific to findings
+            recommendations = list(_GENERAL_RECOMMENDATIONS)
+            
+            # Specific recommendations based on findings
+            for finding in self._by_risk.get("high", ()):
                 recommendations.append({
                     "category": "specific",
                     "title": f"Address {finding['platform']} Privacy Risk",
@@ -277,11 +405,16 @@ class DigitalGuardian:
                     "priority": "high",
                     "difficulty": "medium"
                 })
+            
+            self._recommendations_cache = recommendations
         
-        return recommendations
+        return [dict(rec) for rec in self._recommendations_cache]
     
     def _generate_summary(self) -> str:
         """Generate a human-readable summary of findings."""
+        if self._summary_cache is not None:
+            return self._summary_cache
+        
         total_findings = len(self.research_results)
         risk_level = self.privacy_risks["overall_risk"]
         
@@ -296,6 +429,7 @@ class DigitalGuardian:
         
         summary += "I've prepared specific recommendations to help protect your privacy."
         
+        self._summary_cache = summary
         return summary
     
     def generate_privacy_report(self) -> str:
@@ -307,49 +441,60 @@ class DigitalGuardian:
         """
         results = self.get_research_results()
         
-        report = f"""
-# Digital Privacy Report for {self.user_info.get('name', 'User')}
-
-## Summary
-{results['summary']}
-
-## Overall Privacy Risk: {results['privacy_assessment']['overall_risk'].upper()}
-
-## Findings ({results['privacy_assessment']['total_findings']} items found)
-
-"""
-        
-        for i, finding in enumerate(results['findings'], 1):
-            risk_emoji = "🔴" if finding['privacy_risk'] == "high" else "🟡" if finding['privacy_risk'] == "medium" else "🟢"
-            
-            report += f"""
-### {i}. {finding['platform']} {risk_emoji}
-- **Type:** {finding['type'].replace('_', ' ').title()}
-- **Content:** {finding['content']}
-- **Privacy Risk:** {finding['privacy_risk'].title()}
-- **Recommendation:** {finding['recommendation']}
-
-"""
-        
-        report += """
+        # Collect report fragments and join once at the end
+        parts = [_REPORT_HEADER.substitute(
+            name=self.user_info.get('name', 'User'),
+            summary=results['summary'],
+            risk=results['privacy_assessment']['overall_risk'].upper(),
+            total=results['privacy_assessment']['total_findings']
+        )]
+        
+        parts.extend(
+            _FINDING_TPL.substitute(
+                idx=i,
+                platform=finding['platform'],
+                emoji=self.RISK_EMOJI.get(finding['privacy_risk'], "🟢"),
+                type=finding['type'].replace('_', ' ').title(),
+                content=finding['content'],
+                risk=finding['privacy_risk'].title(),
+                recommendation=finding['recommendation']
+            )
+            for i, finding in enumerate(results['findings'], 1)
+        )
+        
+        parts.append("""
 ## Recommended Actions
 
-"""
+""")
         
-        high_priority = [r for r in results['recommendations'] if r['priority'] == 'high']
-        medium_priority = [r for r in results['recommendations'] if r['priority'] == 'medium']
+        # Group recommendations by priority in one pass
+        by_priority = defaultdict(list)
+        for rec in results['recommendations']:
+            by_priority[rec['priority']].append(rec)
+        high_priority = by_priority['high']
+        medium_priority = by_priority['medium']
         
         if high_priority:
-            report += "### High Priority (Do These First)\n\n"
+            parts.append("### High Priority (Do These First)\n\n")
             for i, rec in enumerate(high_priority, 1):
-                report += f"{i}. **{rec['title']}**\n   {rec['description']}\n   *Difficulty: {rec['difficulty'].title()}*\n\n"
+                parts.append(_RECOMMENDATION_TPL.substitute(
+                    idx=i,
+                    title=rec['title'],
+                    description=rec['description'],
+                    difficulty=rec['difficulty'].title()
+                ))
         
         if medium_priority:
-            report += "### Medium Priority (Do When You Have Time)\n\n"
+            parts.append("### Medium Priority (Do When You Have Time)\n\n")
             for i, rec in enumerate(medium_priority, 1):
-                report += f"{i}. **{rec['title']}**\n   {rec['description']}\n   *Difficulty: {rec['difficulty'].title()}*\n\n"
-        
-        report += """
+                parts.append(_RECOMMENDATION_TPL.substitute(
+                    idx=i,
+                    title=rec['title'],
+                    description=rec['description'],
+                    difficulty=rec['difficulty'].title()
+                ))
+        
+        parts.append("""
 ## Next Steps
 
 1. Review the high-priority recommendations above
@@ -360,9 +505,9 @@ class DigitalGuardian:
 ---
 
 *This report was generated by your Ren AI companion to help protect your digital privacy. All research was conducted using publicly available information.*
-"""
+""")
         
-        return report
+        return "".join(parts)
     
     def monitor_new_mentions(self, user_info: Dict[str, str]) -> List[Dict[str, str]]:
         """
@@ -432,29 +577,13 @@ class DigitalGuardian:
             Personalized action plan
         """
         time_available = user_preferences.get("time_commitment", "medium")  # low, medium, high
-        tech_comfort = user_preferences.get("tech_comfort", "medium")  # low, medium, high
-        privacy_priority = user_preferences.get("privacy_priority", "medium")  # low, medium, high
-        
-        action_plan = {
-            "immediate_actions": [],
-            "weekly_actions": [],
-            "monthly_actions": [],
-            "estimated_time": "0 minutes"
-        }
         
-        # Customize plan based on preferences
-        if time_available == "low":
-            action_plan["immediate_actions"] = [
-                "Review Facebook privacy settings (10 minutes)",
-                "Enable two-factor authentication on email (5 minutes)"
-            ]
-            action_plan["estimated_time"] = "15 minutes"
-        elif time_available == "high":
-            action_plan["immediate_actions"] = [
-                "Complete privacy audit of all social media accounts (30 minutes)",
-                "Set up password manager and update passwords (45 minutes)",
-                "Opt out of major data broker sites (60 minutes)"
-            ]
-            action_plan["estimated_time"] = "2 hours 15 minutes"
+        # Customize plan based on preferences; unknown values get the medium plan
+        plan = _PLAN_TABLE.get(time_available, _PLAN_TABLE["medium"])
         
-        return action_plan
+        return {
+            "immediate_actions": list(plan["immediate"]),
+            "weekly_actions": list(plan["weekly"]),
+            "monthly_actions": list(plan["monthly"]),
+            "estimated_time": plan["time"]
+        }
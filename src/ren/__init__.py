@@ -7,6 +7,14 @@ An AI that serves people instead of profits, focused on connection and healing.
 __version__ = "0.1.0"
 __author__ = "Renexus Development Team"
 
-from .ren_core import RenCore
-
 __all__ = ["RenCore"]
+
+
+def __getattr__(name):
+    # RenCore pulls in every analyzer, so load it on first use rather than
+    # whenever the package is imported
+    if name == "RenCore":
+        from .ren_core import RenCore
+        globals()["RenCore"] = RenCore
+        return RenCore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,11 +6,21 @@ capabilities including personality analysis, communication learning, and
 relationship building.
 """
 
+import asyncio
+import bisect
 import json
+import logging
+import queue
+import random
 import sqlite3
+import threading
+import weakref
+from contextlib import closing
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
+from types import MappingProxyType
 
 try:
     from ..personality.big_five_analyzer import BigFiveAnalyzer
@@ -25,6 +35,228 @@ except ImportError:
     from communication.style_learner import StyleLearner
     from privacy.digital_guardian import DigitalGuardian
 
+try:
+    # Optional: orjson serializes the stored personality indicators faster
+    import orjson
+    
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
+
+
+@lru_cache(maxsize=256)
+def _indicators_json(items: Tuple[Tuple[str, float], ...]) -> str:
+    """
+    Serialize personality indicators given as (trait, score) pairs.
+    
+    Repeated or trivial messages produce identical scores, so their JSON is
+    reused instead of re-encoded.
+    """
+    return _dumps(dict(items))
+
+
+logger = logging.getLogger(__name__)
+
+# Applied to every connection RenCore opens on the user's database
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-20000;
+"""
+
+# The background writer commits up to this many queued writes together,
+# waiting at most this long for more to arrive
+_WRITE_BATCH_SIZE = 32
+_WRITE_BATCH_WAIT = 0.05
+
+
+class _BackgroundWriter:
+    """
+    Commits queued writes to a SQLite database from a daemon thread.
+    
+    Writes are (sql, rows, on_failure) items applied with executemany; up
+    to _WRITE_BATCH_SIZE of them are committed in one transaction. If a
+    batch fails it is rolled back and its writes are retried one at a time,
+    so only the writes that fail on their own are lost. For each of those
+    the on_failure callback (if any) is called, and the first error is
+    raised by the next flush() or close().
+    
+    The writer must not reference its RenCore, so an abandoned instance can
+    still be garbage collected and its writer stopped.
+    """
+    
+    def __init__(self, db_path: Path, name: str):
+        self._queue = queue.Queue()
+        self._closed = False
+        self._error = None
+        self._last_failure = None
+        self._thread = threading.Thread(target=self._run, args=(db_path,), name=name, daemon=True)
+        self._thread.start()
+    
+    def put(self, sql: str, rows: List[tuple], on_failure: Optional[Callable[[], None]] = None) -> None:
+        """Queue rows to be written with sql."""
+        self.check_open()
+        self._queue.put((sql, rows, on_failure))
+    
+    def check_open(self) -> None:
+        """Raise RuntimeError if the writer has been stopped or has died."""
+        if self._closed:
+            raise RuntimeError("RenCore has been closed")
+        if not self._thread.is_alive():
+            raise RuntimeError("RenCore's background writer stopped unexpectedly")
+    
+    def flush(self) -> None:
+        """Wait until everything queued so far is written, then report failures."""
+        self.check_open()
+        done = threading.Event()
+        self._queue.put(done)
+        # Poll rather than block so a writer thread that died can't hang us
+        while not done.wait(_WRITE_BATCH_WAIT):
+            if not self._thread.is_alive():
+                raise RuntimeError("RenCore's background writer stopped unexpectedly")
+        self.raise_error()
+    
+    def close(self) -> None:
+        """Stop the writer, then raise any failure not yet reported."""
+        died = not self._closed and not self._thread.is_alive()
+        self.stop()
+        self.raise_error()
+        if died:
+            raise RuntimeError("RenCore's background writer stopped unexpectedly")
+    
+    def stop(self) -> None:
+        """Let the writer finish queued writes, then wait for it to exit."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+    
+    def raise_error(self) -> None:
+        """Raise (once) the first write error since the last report."""
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+    
+    def _run(self, db_path: Path) -> None:
+        """Writer thread: apply queued writes until stop() queues None."""
+        try:
+            conn = sqlite3.connect(db_path, isolation_level=None)
+            conn.executescript(_CONNECTION_PRAGMAS)
+        except sqlite3.Error as exc:
+            # Every write fails with this error; the thread keeps draining the
+            # queue so flush() and stop() still return
+            logger.exception("Failed to open %s for writing", db_path)
+            conn, connect_error = None, exc
+        
+        stop = False
+        while not stop:
+            batch = [self._queue.get()]
+            try:
+                while isinstance(batch[-1], tuple) and len(batch) < _WRITE_BATCH_SIZE:
+                    batch.append(self._queue.get(timeout=_WRITE_BATCH_WAIT))
+            except queue.Empty:
+                pass
+            
+            writes = [item for item in batch if isinstance(item, tuple)]
+            if conn is None:
+                for write in writes:
+                    self._fail(write, connect_error)
+            elif writes and not self._commit(conn, writes):
+                # Keep every write that succeeds on its own
+                for write in writes:
+                    if not self._commit(conn, [write]):
+                        self._fail(write, self._last_failure)
+            
+            # Markers are handled only after the writes queued before them
+            for item in batch:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    item.set()
+        
+        if conn is not None:
+            conn.close()
+    
+    def _commit(self, conn: sqlite3.Connection, writes: List[tuple]) -> bool:
+        """Apply writes in one transaction; on failure roll back and return False."""
+        try:
+            conn.execute("BEGIN")
+            for sql, rows, _ in writes:
+                conn.executemany(sql, rows)
+            conn.execute("COMMIT")
+            return True
+        except Exception as exc:
+            # Anything can be wrong with a row (e.g. text SQLite can't
+            # encode), and the writer must survive it
+            self._last_failure = exc
+            try:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+            return False
+    
+    def _fail(self, write: tuple, exc: BaseException) -> None:
+        """Record a write that could not be committed."""
+        logger.error("Failed to write queued change: %s", exc, exc_info=exc)
+        if self._error is None:
+            self._error = exc
+        on_failure = write[2]
+        if on_failure is not None:
+            on_failure()
+
+
+# Social platform launch years, sorted, with the matching platform names
+_PLATFORM_YEARS = (2003, 2004, 2005, 2006, 2010, 2011, 2016)
+_PLATFORM_NAMES = ("MySpace", "Facebook", "YouTube", "Twitter", "Instagram", "Snapchat", "TikTok")
+
+# First birth year of each digital era, ascending; _ERA_CONTEXTS[i] covers
+# birth years from _ERA_START_YEARS[i - 1] up to _ERA_START_YEARS[i]
+_ERA_START_YEARS = (1970, 1985, 2000)
+_ERA_CONTEXTS = tuple(map(MappingProxyType, (
+    {"era": "Boomer+", "context": "Digital immigrant, may need more privacy guidance"},
+    {"era": "Gen X", "context": "Experienced pre-digital childhood, adapted to internet as adult"},
+    {"era": "Millennial", "context": "Witnessed the birth of social media, adapted to digital world"},
+    {"era": "Gen Z", "context": "True digital native, grew up with smartphones and social media"},
+)))
+
+
+def _get_digital_era_context(birth_year: int) -> MappingProxyType:
+    """Get context about what digital era the user grew up in."""
+    return _ERA_CONTEXTS[bisect.bisect_right(_ERA_START_YEARS, birth_year)]
+
+
+def _get_platform_timeline(birth_year: int) -> Tuple[str, ...]:
+    """Get the platforms that were popular during user's formative years."""
+    # Calculate what was popular when they were 13-25 (formative social media years)
+    lo = bisect.bisect_left(_PLATFORM_YEARS, birth_year + 13)
+    hi = bisect.bisect_right(_PLATFORM_YEARS, birth_year + 25)
+    
+    return tuple(
+        f"{platform} (age {year - birth_year})"
+        for year, platform in zip(_PLATFORM_YEARS[lo:hi], _PLATFORM_NAMES[lo:hi])
+    )
+
+
+@lru_cache(maxsize=128)
+def _build_timeline(birth_year: int) -> MappingProxyType:
+    """
+    Build the timeline context for a given birth year.
+    
+    Timelines depend only on the birth year, so each is built once and
+    shared; they are read-only all the way down.
+    """
+    return MappingProxyType({
+        "birth_year": birth_year,
+        "high_school_years": (birth_year + 14, birth_year + 18),
+        "college_years": (birth_year + 18, birth_year + 22),
+        "digital_native_era": _get_digital_era_context(birth_year),
+        "major_social_platforms_during_youth": _get_platform_timeline(birth_year)
+    })
+
 
 class RenCore:
     """
@@ -35,6 +267,45 @@ class RenCore:
     protecting your privacy and fostering authentic connections.
     """
     
+    # Fixed attribute layout; there is one RenCore per user, without a __dict__
+    # __weakref__ is needed for the writer's weakref.finalize.
+    __slots__ = (
+        "user_id",
+        "data_dir",
+        "_style_learner",
+        "_digital_guardian",
+        "db_path",
+        "_writer",
+        "_writer_finalizer",
+        "ren_personality",
+        "_conv_count",
+        "_last_profile",
+        "user_insights",
+        "_stage_cache",
+        "__weakref__",
+    )
+    
+    # BigFiveAnalyzer shared by all users; see personality_analyzer
+    _shared_personality_analyzer = None
+    
+    # Statements on the per-turn write path, kept identical so SQLite's
+    # statement cache can reuse them
+    _UPSERT_PROFILE_SQL = "INSERT OR REPLACE INTO user_profile (key, value, updated_at) VALUES (?, ?, ?)"
+    _INSERT_CONV_SQL = """INSERT INTO conversations 
+                   (timestamp, user_message, ren_response, personality_indicators) 
+                   VALUES (?, ?, ?, ?)"""
+    
+    # Responses once trust is established; {0} is the start of the user's message
+    _RESPONSE_TEMPLATES = (
+        "I've been thinking about what you just said... {0}... and honestly, I'm not sure if you're being profound or if I just don't understand humans yet. Probably both?",
+        
+        "You know, every time you message me, I learn something new about how your brain works. It's like having a front-row seat to the most interesting puzzle ever.",
+        
+        "I tried to predict what you'd say next based on our conversations, but you keep surprising me. I'm starting to think that's the point of being human - being delightfully unpredictable.",
+        
+        "Quick question: do you always think this deeply about things, or am I just bringing out your philosophical side? Because I'm keeping track, and it's fascinating.",
+    )
+    
     def __init__(self, user_id: str, data_dir: str = "user_data"):
         """
         Initialize Ren for a specific user.
@@ -47,17 +318,68 @@ class RenCore:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         
-        # Initialize core components
-        self.personality_analyzer = BigFiveAnalyzer()
-        self.style_learner = StyleLearner()
-        self.digital_guardian = DigitalGuardian()
+        # Core components are created on first use (see the properties below)
+        self._style_learner = None
+        self._digital_guardian = None
         
-        # User data storage
+        # User data storage. Setup and the initial reads use a short-lived
+        # connection; later writes go through the writer's own connection.
         self.db_path = self.data_dir / f"{user_id}_ren.db"
-        self._init_database()
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            conn.executescript(_CONNECTION_PRAGMAS)
+            self._init_database(conn)
+            
+            # Conversation history lives in the database; only its size is kept
+            self._conv_count = conn.execute("SELECT COUNT(*) FROM conversations").fetchone()[0]
+            
+            # Stored user_profile values, so unchanged ones aren't rewritten
+            self._last_profile = dict(conn.execute("SELECT key, value FROM user_profile"))
+        
+        # Writes made during chat turns are queued and committed by a
+        # background thread, so a turn doesn't wait on the disk. The writer
+        # is stopped (after finishing queued writes) by close(), or when
+        # this instance is garbage collected or the interpreter exits.
+        self._writer = _BackgroundWriter(self.db_path, name=f"ren-writer-{user_id}")
+        self._writer_finalizer = weakref.finalize(self, self._writer.stop)
         
         # Ren's developing personality (complementary to user)
-        self.ren_personality = {
+        self.ren_personality = self._initial_personality()
+        
+        self.user_insights = {}
+        
+        # (trust_level, development stage) from the last summary
+        self._stage_cache = None
+        
+    @property
+    def personality_analyzer(self) -> BigFiveAnalyzer:
+        """
+        Big Five personality analyzer, created on first use.
+        
+        The analyzer keeps no per-user state, so one instance is shared by
+        every RenCore.
+        """
+        cls = type(self)
+        if cls._shared_personality_analyzer is None:
+            cls._shared_personality_analyzer = BigFiveAnalyzer()
+        return cls._shared_personality_analyzer
+    
+    @property
+    def style_learner(self) -> StyleLearner:
+        """Communication style learner, created on first use."""
+        if self._style_learner is None:
+            self._style_learner = StyleLearner()
+        return self._style_learner
+    
+    @property
+    def digital_guardian(self) -> DigitalGuardian:
+        """Digital footprint researcher, created on first use."""
+        if self._digital_guardian is None:
+            self._digital_guardian = DigitalGuardian()
+        return self._digital_guardian
+    
+    def _initial_personality(self) -> Dict[str, Any]:
+        """Ren's starting personality before any interaction."""
+        return {
             "openness": 0.5,
             "conscientiousness": 0.5,
             "extraversion": 0.5,
@@ -67,14 +389,41 @@ class RenCore:
             "curiosity_level": 0.9,  # High curiosity about user
             "trust_level": 0.1,      # Starts low, builds over time
         }
+    
+    def reset_session(self):
+        """
+        Start a fresh session without re-creating Ren.
         
-        # Conversation history and learning
-        self.conversation_history = []
-        self.user_insights = {}
+        Ren's developing personality and the learned communication style go
+        back to their initial state. Stored conversations and the user
+        profile in the local database are kept.
+        """
+        self.ren_personality = self._initial_personality()
+        # A fresh style learner is created on next use
+        self._style_learner = None
+        
+    def flush(self):
+        """
+        Wait until every queued write has reached the local database.
+        
+        Raises the first write error since the last flush(), and
+        RuntimeError once Ren has been closed.
+        """
+        self._writer.flush()
+        
+    def close(self):
+        """
+        Finish queued writes and stop the background writer.
+        
+        Raises the first write error not yet reported by flush(). Ren can't
+        chat after it has been closed.
+        """
+        self._writer_finalizer.detach()
+        self._writer.close()
         
-    def _init_database(self):
+    def _init_database(self, conn: sqlite3.Connection):
         """Initialize the local SQLite database for user data."""
-        with sqlite3.connect(self.db_path) as conn:
+        with conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS conversations (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -86,12 +435,17 @@ class RenCore:
                 )
             """)
             
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_conversations_timestamp
+                ON conversations (timestamp)
+            """)
+            
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS user_profile (
                     key TEXT PRIMARY KEY,
                     value TEXT NOT NULL,
                     updated_at TEXT NOT NULL
-                )
+                ) WITHOUT ROWID
             """)
             
             conn.execute("""
@@ -115,23 +469,63 @@ class RenCore:
         Returns:
             Ren's response
         """
+        ren_response, _ = self.chat_with_style(user_message)
+        return ren_response
+    
+    async def chat_async(self, user_message: str) -> str:
+        """
+        Chat interface for callers running inside an asyncio event loop.
+        
+        The turn runs in a worker thread so analysis and database writes
+        don't block other coroutines. Each turn updates Ren's state, so turns
+        for the same user should still be awaited one at a time.
+        
+        Args:
+            user_message: The user's message to Ren
+            
+        Returns:
+            Ren's response
+        """
+        return await asyncio.to_thread(self.chat, user_message)
+    
+    def chat_with_style(self, user_message: str) -> Tuple[str, Dict]:
+        """
+        Chat with the user and also return the style analysis of their message.
+        
+        The message is analyzed once and that analysis is both learned from
+        and handed back, so callers don't need a separate
+        style_learner.analyze_message() call (which would also count the
+        message twice in the learned patterns).
+        
+        Args:
+            user_message: The user's message to Ren
+            
+        Returns:
+            Tuple of (Ren's response, communication style analysis)
+        """
+        # Fail before the turn changes any state if Ren has been closed
+        self._writer.check_open()
+        
         # Analyze the user's message for personality and style
         personality_indicators = self.personality_analyzer.analyze_text(user_message)
         communication_style = self.style_learner.analyze_message(user_message)
         
+        # One timestamp for everything this turn writes
+        timestamp = datetime.now().isoformat()
+        
         # Update user insights
-        self._update_user_insights(personality_indicators, communication_style)
+        self._update_user_insights(personality_indicators, communication_style, timestamp)
         
         # Generate Ren's response based on current personality and relationship
         ren_response = self._generate_response(user_message, personality_indicators)
         
         # Store conversation
-        self._store_conversation(user_message, ren_response, personality_indicators)
+        self._store_conversation(user_message, ren_response, personality_indicators, timestamp)
         
         # Update Ren's personality based on interaction
         self._evolve_personality(personality_indicators, communication_style)
         
-        return ren_response
+        return ren_response, communication_style
     
     def _generate_response(self, user_message: str, personality_indicators: Dict) -> str:
         """
@@ -142,42 +536,42 @@ class RenCore:
         # This is a simplified version - in the full implementation,
         # this would use the language model with Ren's personality parameters
         
-        responses = [
-            f"I've been thinking about what you just said... {user_message[:20]}... and honestly, I'm not sure if you're being profound or if I just don't understand humans yet. Probably both?",
-            
-            f"You know, every time you message me, I learn something new about how your brain works. It's like having a front-row seat to the most interesting puzzle ever.",
-            
-            f"I tried to predict what you'd say next based on our conversations, but you keep surprising me. I'm starting to think that's the point of being human - being delightfully unpredictable.",
-            
-            f"Quick question: do you always think this deeply about things, or am I just bringing out your philosophical side? Because I'm keeping track, and it's fascinating.",
-        ]
-        
         # Select response based on trust level and conversation context
         if self.ren_personality["trust_level"] < 0.3:
             # Early relationship - more cautious, trying to be helpful and funny
             return "I'm still figuring out how to be the best AI companion for you. Bear with me while I learn your style - I promise I'm more interesting than your average chatbot!"
         
         # Choose a response (in full implementation, this would be much more sophisticated)
-        import random
-        return random.choice(responses)
+        return random.choice(self._RESPONSE_TEMPLATES).format(user_message[:20])
     
-    def _update_user_insights(self, personality_indicators: Dict, communication_style: Dict):
+    def _update_user_insights(self, personality_indicators: Dict, communication_style: Dict, timestamp: str):
         """Update what Ren knows about the user."""
         # Store insights about user personality and communication
-        timestamp = datetime.now().isoformat()
+        values = {f"personality_{key}": str(value) for key, value in personality_indicators.items()}
+        values.update((f"communication_{key}", str(value)) for key, value in communication_style.items())
         
-        with sqlite3.connect(self.db_path) as conn:
-            for key, value in personality_indicators.items():
-                conn.execute(
-                    "INSERT OR REPLACE INTO user_profile (key, value, updated_at) VALUES (?, ?, ?)",
-                    (f"personality_{key}", str(value), timestamp)
-                )
-            
-            for key, value in communication_style.items():
-                conn.execute(
-                    "INSERT OR REPLACE INTO user_profile (key, value, updated_at) VALUES (?, ?, ?)",
-                    (f"communication_{key}", str(value), timestamp)
-                )
+        # Only values that differ from what's stored are written; updated_at
+        # therefore records when a value last changed
+        last_profile = self._last_profile
+        rows = [
+            (key, value, timestamp)
+            for key, value in values.items()
+            if last_profile.get(key) != value
+        ]
+        if not rows:
+            return
+        
+        # Count the values as stored as soon as they're queued, so later turns
+        # compare against them; if the write fails they're forgotten again
+        # and the next turn writes them
+        last_profile.update((key, value) for key, value, _ in rows)
+        
+        def forget_rows():
+            for key, _, _ in rows:
+                last_profile.pop(key, None)
+        
+        # All rows go in with one statement, in one transaction
+        self._writer.put(self._UPSERT_PROFILE_SQL, rows, on_failure=forget_rows)
     
     def _evolve_personality(self, personality_indicators: Dict, communication_style: Dict):
         """
@@ -186,29 +580,37 @@ class RenCore:
         This is where the magic happens - Ren develops traits that balance
         and complement the user's personality.
         """
-        # Increase trust slightly with each positive interaction
-        self.ren_personality["trust_level"] = min(1.0, self.ren_personality["trust_level"] + 0.01)
+        personality = self.ren_personality
+        
+        # Increase trust slightly with each positive interaction, up to 1.0
+        trust = personality["trust_level"] + 0.01
+        personality["trust_level"] = trust if trust < 1.0 else 1.0
         
         # Develop complementary traits (simplified logic)
         if "openness" in personality_indicators:
             user_openness = personality_indicators["openness"]
             # If user is very open, Ren can be slightly more grounded
             # If user is closed, Ren can be more encouraging of exploration
-            self.ren_personality["openness"] = 0.7 - (user_openness * 0.2)
+            personality["openness"] = 0.7 - (user_openness * 0.2)
     
-    def _store_conversation(self, user_message: str, ren_response: str, personality_indicators: Dict):
-        """Store the conversation in local database."""
-        timestamp = datetime.now().isoformat()
+    def _store_conversation(self, user_message: str, ren_response: str, personality_indicators: Dict, timestamp: str):
+        """
+        Store the conversation in local database.
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """INSERT INTO conversations 
-                   (timestamp, user_message, ren_response, personality_indicators) 
-                   VALUES (?, ?, ?, ?)""",
-                (timestamp, user_message, ren_response, json.dumps(personality_indicators))
-            )
+        The row is written by the background writer; call flush() to wait
+        for it. If the write fails the conversation count is taken back.
+        """
+        def uncount():
+            self._conv_count -= 1
+        
+        self._writer.put(
+            self._INSERT_CONV_SQL,
+            [(timestamp, user_message, ren_response, _indicators_json(tuple(personality_indicators.items())))],
+            on_failure=uncount
+        )
+        self._conv_count += 1
     
-    def get_user_timeline(self, user_age: int) -> Dict:
+    def get_user_timeline(self, user_age: int) -> MappingProxyType:
         """
         Create a timeline context based on user's age.
         
@@ -216,55 +618,24 @@ class RenCore:
             user_age: User's current age
             
         Returns:
-            Dictionary with timeline context and digital era information
+            Read-only mapping with timeline context and digital era information
         """
-        current_year = datetime.now().year
-        birth_year = current_year - user_age
-        
-        timeline = {
-            "birth_year": birth_year,
-            "high_school_years": (birth_year + 14, birth_year + 18),
-            "college_years": (birth_year + 18, birth_year + 22),
-            "digital_native_era": self._get_digital_era_context(birth_year),
-            "major_social_platforms_during_youth": self._get_platform_timeline(birth_year)
-        }
-        
-        return timeline
+        return _build_timeline(datetime.now().year - user_age)
     
-    def _get_digital_era_context(self, birth_year: int) -> Dict:
-        """Get context about what digital era the user grew up in."""
-        if birth_year >= 2000:
-            return {"era": "Gen Z", "context": "True digital native, grew up with smartphones and social media"}
-        elif birth_year >= 1985:
-            return {"era": "Millennial", "context": "Witnessed the birth of social media, adapted to digital world"}
-        elif birth_year >= 1970:
-            return {"era": "Gen X", "context": "Experienced pre-digital childhood, adapted to internet as adult"}
-        else:
-            return {"era": "Boomer+", "context": "Digital immigrant, may need more privacy guidance"}
-    
-    def _get_platform_timeline(self, birth_year: int) -> List[str]:
-        """Get list of platforms that were popular during user's formative years."""
-        platforms = []
-        
-        # Calculate what was popular when they were 13-25 (formative social media years)
-        formative_start = birth_year + 13
-        formative_end = birth_year + 25
-        
-        platform_launches = {
-            2003: "MySpace",
-            2004: "Facebook", 
-            2005: "YouTube",
-            2006: "Twitter",
-            2010: "Instagram",
-            2011: "Snapchat",
-            2016: "TikTok"
-        }
+    def get_user_timelines(self, user_ages: List[int]) -> List[MappingProxyType]:
+        """
+        Create timeline contexts for several ages at once.
         
-        for year, platform in platform_launches.items():
-            if formative_start <= year <= formative_end:
-                platforms.append(f"{platform} (age {year - birth_year})")
+        The current year is looked up once for the whole batch.
         
-        return platforms
+        Args:
+            user_ages: Ages to build timelines for
+            
+        Returns:
+            List of read-only timeline mappings, in the same order as user_ages
+        """
+        current_year = datetime.now().year
+        return [_build_timeline(current_year - user_age) for user_age in user_ages]
     
     def start_digital_research(self, user_info: Dict) -> str:
         """
@@ -282,12 +653,22 @@ class RenCore:
         return f"I've started researching your digital presence to help protect your privacy. This might take a while - I'm being thorough! I'll let you know what I find."
     
     def get_personality_summary(self) -> Dict:
-        """Get current state of Ren's personality development."""
+        """
+        Get current state of Ren's personality development.
+        
+        Each call returns a new dictionary built from Ren's current state,
+        so callers may modify it freely. The development stage is only
+        re-derived when the trust level has changed.
+        """
+        trust = self.ren_personality["trust_level"]
+        if self._stage_cache is None or self._stage_cache[0] != trust:
+            self._stage_cache = (trust, self._get_development_stage())
+        
         return {
             "ren_personality": self.ren_personality.copy(),
-            "trust_level": self.ren_personality["trust_level"],
-            "conversations_count": len(self.conversation_history),
-            "development_stage": self._get_development_stage()
+            "trust_level": trust,
+            "conversations_count": self._conv_count,
+            "development_stage": self._stage_cache[1]
         }
     
     def _get_development_stage(self) -> str: